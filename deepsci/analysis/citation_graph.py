@@ -4,35 +4,132 @@ Fetches citations and references from Semantic Scholar to create relationship gr
 """
 
 import networkx as nx
-from semanticscholar import SemanticScholar
-from typing import List, Dict, Optional, Set, Tuple
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pathlib import Path
+from typing import List, Dict, Optional, Set, Tuple, Union
+import json
+import os
+import re
 import time
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 import logging
+from deepsci.sources.citation_cache import CitationCache
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# arXiv ID normalization: optional "arXiv:" prefix and trailing version (v1, v2, ...)
+_ARXIV_PREFIX = re.compile(r'^arxiv:', re.IGNORECASE)
+_ARXIV_VERSION = re.compile(r'v\d+$')
+
+# Below this many edges NetworkX is fast enough that copying the graph into
+# igraph costs more than it saves
+IGRAPH_EDGE_THRESHOLD = 5000
+
+S2_BATCH_URL = "https://api.semanticscholar.org/graph/v1/paper/batch"
+
+# The batch endpoint accepts up to 500 IDs; smaller chunks keep responses
+# with full citation/reference lists at a manageable size
+BATCH_SIZE = 100
+
+BASE_FIELDS = [
+    'title', 'year', 'authors', 'citationCount',
+    'referenceCount', 'influentialCitationCount', 'abstract'
+]
+
+# Citations and references only need their external IDs to find arXiv papers
+PAPER_FIELDS = BASE_FIELDS + ['citations.externalIds', 'references.externalIds']
+
+# Citing/cited papers considered per paper (limits graph explosion)
+MAX_NEIGHBORS = 50
+
+# Per-paper fields build_graph reads; only these are written to the disk cache
+_CACHED_FIELDS = (
+    'title', 'year', 'authors', 'author_str', 'citation_count',
+    'influential_citations', 'citing_ids', 'reference_ids'
+)
+
+
+def format_authors(authors: List[str]) -> str:
+    """Format an author list for display (first three, then 'et al.')"""
+    if not authors:
+        return 'Unknown'
+    author_str = ', '.join(authors[:3])
+    if len(authors) > 3:
+        author_str += f' et al. ({len(authors)} total)'
+    return author_str
+
 
 class CitationGraph:
     """Build and analyze citation networks from paper relationships"""
     
-    def __init__(self, delay_seconds: float = 1.0, max_depth: int = 1):
+    def __init__(
+        self,
+        delay_seconds: float = 1.0,
+        max_depth: int = 1,
+        api_key: Optional[str] = None,
+        use_cache: bool = True,
+        cache_file: str = "./data/graph_cache.json"
+    ):
         """
         Initialize citation graph builder
         
         Args:
             delay_seconds: Delay between API requests
             max_depth: Maximum citation depth (1 = direct citations only)
+            api_key: Semantic Scholar API key (default: S2_API_KEY environment variable)
+            use_cache: Whether to cache fetched papers on disk
+            cache_file: Path to the paper cache file
         """
-        self.sch = SemanticScholar(timeout=10)
+        self.api_key = api_key or os.environ.get('S2_API_KEY')
+        self.timeout = 10
+        self._session = None  # Created on first request, reused across builds
         self.delay_seconds = delay_seconds
         self.max_depth = max_depth
         self.last_request_time = 0
         self.graph = nx.DiGraph()
         self.paper_metadata = {}  # Store paper details
+        self._igraph = None  # Integer-indexed igraph mirror of self.graph
+        self._igraph_size = None
+        self._id2vid = {}
+        self._vid2id = []
+        self._centrality_cache = None  # (graph size, PageRank scores)
+        self._in_degree_cache = None  # (graph size, in-degree by node)
+        self.cache = CitationCache(cache_file=cache_file) if use_cache else None
+        self._unsaved = {}  # Fetched papers not yet written to the cache
         
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _get_session(self) -> requests.Session:
+        """Get the shared HTTP session (keep-alive, retries on 429/5xx)"""
+        if self._session is None:
+            retry = Retry(
+                total=5,
+                backoff_factor=1.0,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "POST"]
+            )
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+            self._session = requests.Session()
+            self._session.mount('https://', adapter)
+            if self.api_key:
+                self._session.headers['x-api-key'] = self.api_key
+        return self._session
+    
+    def close(self):
+        """Release the HTTP session; a new one is created if more requests are made"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+    
     def _wait_for_rate_limit(self):
         """Ensure we don't exceed rate limits"""
         elapsed = time.time() - self.last_request_time
@@ -40,63 +137,126 @@ class CitationGraph:
             time.sleep(self.delay_seconds - elapsed)
         self.last_request_time = time.time()
     
-    def _fetch_paper_details(self, arxiv_id: str) -> Optional[Dict]:
+    def _clean_arxiv_id(self, arxiv_id: str) -> str:
+        """Strip prefix and version suffix from an arXiv ID"""
+        return _ARXIV_VERSION.sub('', _ARXIV_PREFIX.sub('', arxiv_id))
+    
+    def _parse_paper(self, arxiv_id: str, paper: Dict) -> Dict:
+        """Convert a Semantic Scholar paper record into our metadata dict"""
+        # Handle authors (can be dict or object)
+        authors = []
+        if paper.get('authors'):
+            for a in paper['authors']:
+                if isinstance(a, dict):
+                    authors.append(a.get('name', 'Unknown'))
+                elif hasattr(a, 'name'):
+                    authors.append(a.name)
+                else:
+                    authors.append(str(a))
+        
+        return {
+            'arxiv_id': arxiv_id,
+            'title': paper.get('title'),
+            'year': paper.get('year'),
+            'authors': authors,
+            'author_str': format_authors(authors),
+            'citation_count': paper.get('citationCount') or 0,
+            'reference_count': paper.get('referenceCount') or 0,
+            'influential_citations': paper.get('influentialCitationCount') or 0,
+            'abstract': paper.get('abstract') or '',
+            # arXiv IDs among the first MAX_NEIGHBORS citations/references
+            'citing_ids': self._arxiv_ids((paper.get('citations') or [])[:MAX_NEIGHBORS]),
+            'reference_ids': self._arxiv_ids((paper.get('references') or [])[:MAX_NEIGHBORS])
+        }
+    
+    def _arxiv_ids(self, paper_objs: List) -> List[str]:
+        """arXiv IDs of the given Semantic Scholar papers, skipping non-arXiv ones"""
+        return [arxiv_id for arxiv_id in map(self._extract_arxiv_id, paper_objs) if arxiv_id]
+    
+    def _fetch_batch(self, arxiv_ids: List[str], light: bool = False) -> Dict[str, Dict]:
         """
-        Fetch paper details from Semantic Scholar
+        Fetch details for many papers using Semantic Scholar batch lookups
+        
+        Posts up to BATCH_SIZE IDs per request to the /paper/batch endpoint,
+        so the rate limit is paid once per chunk instead of once per paper.
+        Papers found in the on-disk cache are not requested again; newly
+        fetched ones are queued for it and written by _flush_cache().
         
         Args:
-            arxiv_id: arXiv ID of the paper
+            arxiv_ids: Cleaned arXiv IDs (no prefix or version)
+            light: Skip citation and reference lists (metadata only, much smaller responses)
             
         Returns:
-            Dictionary with paper metadata or None
+            Dictionary mapping arXiv ID to paper metadata (missing papers are omitted)
         """
-        try:
-            self._wait_for_rate_limit()
-            
-            # Clean arxiv ID
-            arxiv_id = arxiv_id.replace('arxiv:', '').replace('arXiv:', '')
-            for version in ['v1', 'v2', 'v3', 'v4', 'v5']:
-                arxiv_id = arxiv_id.replace(version, '')
-            
-            paper = self.sch.get_paper(
-                f'arXiv:{arxiv_id}',
-                fields=[
-                    'title', 'year', 'authors', 'citationCount',
-                    'referenceCount', 'citations', 'references',
-                    'influentialCitationCount', 'abstract'
-                ]
-            )
-            
-            if not paper:
-                return None
+        results = {}
+        session = self._get_session()
+        fields = ','.join(BASE_FIELDS if light else PAPER_FIELDS)
+        
+        # Check cache first
+        missing = arxiv_ids
+        if self.cache:
+            missing = []
+            for arxiv_id in arxiv_ids:
+                cached = self.cache.get(arxiv_id)
+                # Entries from before the cache was trimmed hold full lists instead
+                if cached and 'citing_ids' in cached:
+                    results[arxiv_id] = cached
+                else:
+                    missing.append(arxiv_id)
+        
+        fetched = {}
+        for start in range(0, len(missing), BATCH_SIZE):
+            chunk = missing[start:start + BATCH_SIZE]
             
-            # Handle authors (can be dict or object)
-            authors = []
-            if paper.authors:
-                for a in paper.authors:
-                    if isinstance(a, dict):
-                        authors.append(a.get('name', 'Unknown'))
-                    elif hasattr(a, 'name'):
-                        authors.append(a.name)
-                    else:
-                        authors.append(str(a))
+            try:
+                self._wait_for_rate_limit()
+                response = session.post(
+                    S2_BATCH_URL,
+                    params={'fields': fields},
+                    json={'ids': [f'ARXIV:{arxiv_id}' for arxiv_id in chunk]},
+                    timeout=self.timeout
+                )
+                response.raise_for_status()
+                papers = response.json()
+            except Exception as e:
+                logger.warning(f"Failed to fetch batch of {len(chunk)} papers: {e}")
+                continue
             
-            return {
-                'arxiv_id': arxiv_id,
-                'title': paper.title,
-                'year': paper.year,
-                'authors': authors,
-                'citation_count': paper.citationCount or 0,
-                'reference_count': paper.referenceCount or 0,
-                'influential_citations': paper.influentialCitationCount or 0,
-                'abstract': paper.abstract or '',
-                'citations': paper.citations or [],
-                'references': paper.references or []
-            }
+            # Results are positional: one entry per requested ID, null if not found
+            for arxiv_id, paper in zip(chunk, papers):
+                if paper:
+                    fetched[arxiv_id] = self._parse_paper(arxiv_id, paper)
+        
+        # Queue the results for the cache (light records lack citations, so only full ones)
+        if self.cache and not light:
+            for arxiv_id, paper in fetched.items():
+                self._unsaved[arxiv_id] = {field: paper[field] for field in _CACHED_FIELDS}
+        
+        results.update(fetched)
+        return results
+    
+    def _fetch_paper_details(self, arxiv_id: str, light: bool = False) -> Optional[Dict]:
+        """
+        Fetch paper details from Semantic Scholar
+        
+        Args:
+            arxiv_id: arXiv ID of the paper
+            light: Skip citation and reference lists (they are returned empty)
             
-        except Exception as e:
-            logger.warning(f"Failed to fetch paper {arxiv_id}: {e}")
-            return None
+        Returns:
+            Dictionary with paper metadata or None
+        """
+        arxiv_id = self._clean_arxiv_id(arxiv_id)
+        paper = self._fetch_batch([arxiv_id], light=light).get(arxiv_id)
+        self._flush_cache()
+        return paper
+    
+    def _flush_cache(self):
+        """Write papers fetched since the last flush to the disk cache in one save"""
+        if self.cache and self._unsaved:
+            self.cache.set_many(self._unsaved)
+        self._unsaved = {}
     
     def build_graph(self, arxiv_ids: List[str], include_references: bool = True) -> nx.DiGraph:
         """
@@ -111,8 +271,14 @@ class CitationGraph:
         """
         self.graph = nx.DiGraph()
         self.paper_metadata = {}
+        self._igraph = None
+        self._centrality_cache = None
+        self._in_degree_cache = None
         processed_ids = set()
         
+        # Map each requested ID to its cleaned form; nodes keep the caller's ID
+        clean_ids = {arxiv_id: self._clean_arxiv_id(arxiv_id) for arxiv_id in arxiv_ids}
+        
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -123,43 +289,62 @@ class CitationGraph:
                 total=None
             )
             
+            progress.update(task, description=f"Fetching {len(clean_ids)} papers from Semantic Scholar...")
+            fetched = self._fetch_batch(list(dict.fromkeys(clean_ids.values())))
+            
+            # Neighbours are reported by clean ID; point those that are seed
+            # papers at the seed's node so it is not duplicated as partial
+            node_keys = {}
+            for arxiv_id in arxiv_ids:
+                node_keys.setdefault(clean_ids[arxiv_id], arxiv_id)
+            
+            # Collect nodes and edges, then insert them in bulk
+            paper_nodes = []
+            partial_ids = set()
+            edges = []
+            
             for arxiv_id in arxiv_ids:
                 if arxiv_id in processed_ids:
                     continue
                 
-                progress.update(task, description=f"Fetching: {arxiv_id}")
-                paper = self._fetch_paper_details(arxiv_id)
+                paper = fetched.get(clean_ids[arxiv_id])
                 
                 if not paper:
                     continue
                 
                 # Add paper as node
-                self.graph.add_node(
-                    arxiv_id,
-                    title=paper['title'],
-                    year=paper['year'],
-                    authors=paper['authors'],
-                    citation_count=paper['citation_count'],
-                    influential_citations=paper['influential_citations']
-                )
+                paper_nodes.append((arxiv_id, {
+                    'title': paper['title'],
+                    'year': paper['year'],
+                    'authors': paper['authors'],
+                    'author_str': paper['author_str'],
+                    'citation_count': paper['citation_count'],
+                    'influential_citations': paper['influential_citations']
+                }))
                 
                 self.paper_metadata[arxiv_id] = paper
                 processed_ids.add(arxiv_id)
                 
                 # Add citations (papers that cite this paper)
-                for citation in paper['citations'][:50]:  # Limit to avoid explosion
-                    citing_arxiv = self._extract_arxiv_id(citation)
-                    if citing_arxiv and citing_arxiv not in processed_ids:
-                        self.graph.add_node(citing_arxiv, partial=True)
-                        self.graph.add_edge(citing_arxiv, arxiv_id, type='cites')
+                for citing_arxiv in paper['citing_ids']:
+                    citing_arxiv = node_keys.get(citing_arxiv, citing_arxiv)
+                    partial_ids.add(citing_arxiv)
+                    edges.append((citing_arxiv, arxiv_id))
                 
                 # Add references (papers this paper cites)
                 if include_references:
-                    for reference in paper['references'][:50]:
-                        ref_arxiv = self._extract_arxiv_id(reference)
-                        if ref_arxiv and ref_arxiv not in processed_ids:
-                            self.graph.add_node(ref_arxiv, partial=True)
-                            self.graph.add_edge(arxiv_id, ref_arxiv, type='cites')
+                    for ref_arxiv in paper['reference_ids']:
+                        ref_arxiv = node_keys.get(ref_arxiv, ref_arxiv)
+                        partial_ids.add(ref_arxiv)
+                        edges.append((arxiv_id, ref_arxiv))
+            
+            self.graph.add_nodes_from(paper_nodes)
+            # Only papers not already in the graph become partial nodes, so
+            # fetched metadata is never overwritten with partial=True
+            self.graph.add_nodes_from(partial_ids.difference(self.graph), partial=True)
+            self.graph.add_edges_from(edges, type='cites')
+        
+        self._flush_cache()
         
         console.print(f"[green]✓[/green] Graph built: {self.graph.number_of_nodes()} nodes, {self.graph.number_of_edges()} edges")
         return self.graph
@@ -179,16 +364,53 @@ class CitationGraph:
                 return None
             
             if external_ids and 'ArXiv' in external_ids:
-                arxiv_id = external_ids['ArXiv']
                 # Clean version numbers
-                for version in ['v1', 'v2', 'v3', 'v4', 'v5']:
-                    arxiv_id = arxiv_id.replace(version, '')
-                return arxiv_id
+                return _ARXIV_VERSION.sub('', external_ids['ArXiv'])
         except:
             pass
         
         return None
     
+    def _graph_size(self) -> Tuple[int, int]:
+        """Node and edge counts, used to detect graph changes for cached results"""
+        return (self.graph.number_of_nodes(), self.graph.number_of_edges())
+    
+    def _get_in_degrees(self) -> Dict[str, int]:
+        """Get in-degree for every node, recomputed only when the graph changes"""
+        size = self._graph_size()
+        if self._in_degree_cache is None or self._in_degree_cache[0] != size:
+            self._in_degree_cache = (size, dict(self.graph.in_degree()))
+        return self._in_degree_cache[1]
+    
+    def _to_igraph(self):
+        """
+        Get an igraph copy of the graph with compact integer vertex IDs
+        
+        The copy is rebuilt only when the graph has changed size. arXiv IDs
+        map to vertex IDs through self._id2vid / self._vid2id.
+        
+        Returns:
+            igraph.Graph, or None if the graph is small (at most
+            IGRAPH_EDGE_THRESHOLD edges) or python-igraph is not installed
+        """
+        if self.graph.number_of_edges() <= IGRAPH_EDGE_THRESHOLD:
+            return None
+        
+        try:
+            import igraph
+        except ImportError:
+            return None
+        
+        size = self._graph_size()
+        if self._igraph is None or self._igraph_size != size:
+            self._vid2id = list(self.graph.nodes)
+            self._id2vid = {node: vid for vid, node in enumerate(self._vid2id)}
+            edges = [(self._id2vid[u], self._id2vid[v]) for u, v in self.graph.edges]
+            self._igraph = igraph.Graph(n=len(self._vid2id), edges=edges, directed=True)
+            self._igraph_size = size
+        
+        return self._igraph
+    
     def find_seminal_papers(self, min_citations: int = 10) -> List[Tuple[str, Dict]]:
         """
         Identify influential papers in the graph
@@ -199,35 +421,47 @@ class CitationGraph:
         Returns:
             List of (arxiv_id, metadata) tuples sorted by influence
         """
-        seminal = []
+        # Skip incomplete nodes
+        partial_nodes = {node for node, partial in nx.get_node_attributes(self.graph, 'partial').items() if partial}
+        nodes = [node for node in self.graph.nodes if node not in partial_nodes]
+        if not nodes:
+            return []
         
-        for node, data in self.graph.nodes(data=True):
-            if data.get('partial'):  # Skip incomplete nodes
-                continue
-            
-            citation_count = data.get('citation_count', 0)
-            influential = data.get('influential_citations', 0)
-            
-            if citation_count >= min_citations:
-                # Calculate influence score
-                in_degree = self.graph.in_degree(node)  # How many papers cite it
-                score = citation_count * 0.5 + influential * 2 + in_degree * 10
-                
-                seminal.append((
-                    node,
-                    {
-                        'title': data.get('title', 'Unknown'),
-                        'year': data.get('year', 'N/A'),
-                        'citations': citation_count,
-                        'influential': influential,
-                        'in_graph_citations': in_degree,
-                        'influence_score': score
-                    }
-                ))
-        
-        # Sort by influence score
-        seminal.sort(key=lambda x: x[1]['influence_score'], reverse=True)
-        return seminal
+        # Pull the scoring inputs into columnar arrays once
+        node_data = self.graph.nodes
+        in_degrees = self._get_in_degrees()
+        count = len(nodes)
+        citations = np.fromiter(
+            (node_data[node].get('citation_count', 0) for node in nodes), dtype=np.int64, count=count
+        )
+        influential = np.fromiter(
+            (node_data[node].get('influential_citations', 0) for node in nodes), dtype=np.int64, count=count
+        )
+        in_degree = np.fromiter(
+            (in_degrees[node] for node in nodes), dtype=np.int64, count=count
+        )  # How many papers cite it
+        
+        # Calculate influence score
+        scores = citations * 0.5 + influential * 2 + in_degree * 10
+        
+        # Sort by influence score (stable, so ties keep graph order)
+        candidates = np.flatnonzero(citations >= min_citations)
+        order = candidates[np.argsort(-scores[candidates], kind='stable')]
+        
+        return [
+            (
+                nodes[i],
+                {
+                    'title': node_data[nodes[i]].get('title', 'Unknown'),
+                    'year': node_data[nodes[i]].get('year', 'N/A'),
+                    'citations': int(citations[i]),
+                    'influential': int(influential[i]),
+                    'in_graph_citations': int(in_degree[i]),
+                    'influence_score': float(scores[i])
+                }
+            )
+            for i in order
+        ]
     
     def find_citation_path(self, from_id: str, to_id: str) -> Optional[List[str]]:
         """
@@ -240,6 +474,13 @@ class CitationGraph:
         Returns:
             List of arXiv IDs showing the path, or None if no path exists
         """
+        g = self._to_igraph()
+        if g is not None:
+            if from_id not in self._id2vid or to_id not in self._id2vid:
+                return None
+            path = g.get_shortest_paths(self._id2vid[from_id], to=self._id2vid[to_id], mode='out')[0]
+            return [self._vid2id[vid] for vid in path] if path else None
+        
         try:
             path = nx.shortest_path(self.graph, from_id, to_id)
             return path
@@ -262,11 +503,11 @@ class CitationGraph:
         if not self.graph.has_node(arxiv_id):
             return result
         
-        if direction in ['out', 'both']:
+        if direction in {'out', 'both'}:
             # Papers this paper cites
             result['citing'] = list(self.graph.successors(arxiv_id))
         
-        if direction in ['in', 'both']:
+        if direction in {'in', 'both'}:
             # Papers that cite this paper
             result['cited_by'] = list(self.graph.predecessors(arxiv_id))
         
@@ -276,13 +517,24 @@ class CitationGraph:
         """
         Calculate centrality metrics for all papers
         
+        PageRank scores are cached until the graph changes.
+        
         Returns:
             Dictionary mapping arxiv_id to centrality score
         """
+        size = self._graph_size()
+        if self._centrality_cache is not None and self._centrality_cache[0] == size:
+            return dict(self._centrality_cache[1])
+        
         try:
             # PageRank is good for citation networks
-            centrality = nx.pagerank(self.graph)
-            return centrality
+            g = self._to_igraph()
+            if g is not None:
+                centrality = dict(zip(self._vid2id, g.pagerank()))
+            else:
+                centrality = nx.pagerank(self.graph)
+            self._centrality_cache = (size, centrality)
+            return dict(centrality)
         except:
             # Fallback to simple degree centrality
             return nx.degree_centrality(self.graph)
@@ -290,36 +542,67 @@ class CitationGraph:
     def get_graph_stats(self) -> Dict[str, any]:
         """Get statistics about the citation graph"""
         num_nodes = self.graph.number_of_nodes()
+        # One traversal gives both the component count and connectedness
+        components = nx.number_weakly_connected_components(self.graph) if num_nodes > 0 else 0
         
         return {
             'nodes': num_nodes,
             'edges': self.graph.number_of_edges(),
             'density': nx.density(self.graph) if num_nodes > 0 else 0,
-            'is_connected': nx.is_weakly_connected(self.graph) if num_nodes > 0 else False,
-            'components': nx.number_weakly_connected_components(self.graph) if num_nodes > 0 else 0,
-            'avg_degree': sum(dict(self.graph.degree()).values()) / max(num_nodes, 1)
+            'is_connected': components == 1,
+            'components': components,
+            # Every edge adds one to the total degree of each endpoint, so the
+            # degree sum is always 2 * edges
+            'avg_degree': (2 * self.graph.number_of_edges()) / max(num_nodes, 1)
         }
     
     def export_to_dict(self) -> Dict:
         """Export graph data for visualization"""
-        nodes = []
-        edges = []
+        # Extract each attribute for all nodes in one pass
+        titles = nx.get_node_attributes(self.graph, 'title')
+        years = nx.get_node_attributes(self.graph, 'year')
+        citations = nx.get_node_attributes(self.graph, 'citation_count')
+        partials = nx.get_node_attributes(self.graph, 'partial')
         
-        for node, data in self.graph.nodes(data=True):
-            nodes.append({
+        nodes = [
+            {
                 'id': node,
-                'label': data.get('title', node)[:50],
-                'title': data.get('title', 'Unknown'),
-                'year': data.get('year', 'N/A'),
-                'citations': data.get('citation_count', 0),
-                'partial': data.get('partial', False)
-            })
-        
-        for source, target, data in self.graph.edges(data=True):
-            edges.append({
-                'from': source,
-                'to': target,
-                'type': data.get('type', 'cites')
-            })
+                'label': titles.get(node, node)[:50],
+                'title': titles.get(node, 'Unknown'),
+                'year': years.get(node, 'N/A'),
+                'citations': citations.get(node, 0),
+                'partial': partials.get(node, False)
+            }
+            for node in self.graph.nodes
+        ]
+        
+        edges = [
+            {'from': source, 'to': target, 'type': edge_type}
+            for source, target, edge_type in self.graph.edges(data='type', default='cites')
+        ]
         
         return {'nodes': nodes, 'edges': edges}
+    
+    def export_to_json(self, path: Union[str, Path]) -> Path:
+        """
+        Write the exported graph data to a JSON file
+        
+        Uses orjson when it is installed, otherwise the standard library encoder.
+        
+        Args:
+            path: Output file path
+            
+        Returns:
+            Path to the written file
+        """
+        data = self.export_to_dict()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        try:
+            import orjson
+            path.write_bytes(orjson.dumps(data))
+        except ImportError:
+            path.write_text(json.dumps(data), encoding='utf-8')
+        
+        return path
@@ -1,8 +1,11 @@
 """
 Graph Visualization - Interactive and static citation network visualization
-Supports interactive HTML (pyvis), static images (matplotlib), and terminal ASCII art
+Supports interactive HTML (vis.js), static images (matplotlib), and terminal ASCII art
 """
 
+import json
+import math
+from operator import itemgetter
 import networkx as nx
 from pathlib import Path
 from typing import Optional, Dict
@@ -12,6 +15,73 @@ from rich.table import Table
 
 console = Console()
 
+# Physics and interaction settings for the vis.js network
+VIS_OPTIONS = """
+{
+  "physics": {
+    "enabled": true,
+    "barnesHut": {
+      "gravitationalConstant": -8000,
+      "springLength": 200,
+      "springConstant": 0.04
+    }
+  },
+  "interaction": {
+    "hover": true,
+    "tooltipDelay": 100,
+    "navigationButtons": true,
+    "keyboard": true
+  }
+}
+"""
+
+# Standalone page rendering the network with vis.js; placeholders are
+# replaced with JSON so nodes and edges are serialized in a single pass
+VIS_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Citation Network</title>
+<script src="https://cdnjs.cloudflare.com/ajax/libs/vis-network/9.1.2/dist/vis-network.min.js"></script>
+<link href="https://cdnjs.cloudflare.com/ajax/libs/vis-network/9.1.2/dist/dist/vis-network.min.css" rel="stylesheet">
+<style>
+  body { margin: 0; background-color: #ffffff; }
+  #network { width: 100%; height: 800px; }
+</style>
+</head>
+<body>
+<div id="network"></div>
+<script>
+  var nodes = __NODES__;
+  var edges = __EDGES__;
+  var options = __OPTIONS__;
+  // Render HTML tooltips instead of showing them as plain text
+  nodes.forEach(function (node) {
+    var tooltip = document.createElement("div");
+    tooltip.innerHTML = node.title;
+    node.title = tooltip;
+  });
+  options.nodes = { font: { color: "#000000" } };
+  new vis.Network(
+    document.getElementById("network"),
+    { nodes: new vis.DataSet(nodes), edges: new vis.DataSet(edges) },
+    options
+  );
+</script>
+</body>
+</html>
+"""
+
+
+def _to_script_json(data) -> str:
+    """Serialize data as JSON that is safe to embed in a <script> block"""
+    return json.dumps(data).replace('</', '<\\/')
+
+
+def _partial_nodes(graph: nx.DiGraph) -> set:
+    """Set of nodes marked partial (neighbours whose metadata was not fetched)"""
+    return {node for node, partial in nx.get_node_attributes(graph, 'partial').items() if partial}
+
 
 class GraphVisualizer:
     """Visualize citation networks in multiple formats"""
@@ -31,67 +101,41 @@ class GraphVisualizer:
         graph: nx.DiGraph,
         paper_metadata: Dict = None,
         output_file: str = "citation_network.html",
-        auto_open: bool = True
+        auto_open: bool = True,
+        use_pyvis: bool = False
     ) -> Path:
         """
-        Create interactive HTML visualization with pyvis
+        Create interactive HTML visualization with vis.js
         
         Args:
             graph: NetworkX graph to visualize
             paper_metadata: Optional metadata for enriching visualization
             output_file: Output filename
             auto_open: Whether to open in browser automatically
+            use_pyvis: Build the page through pyvis instead of the built-in template
             
         Returns:
             Path to generated HTML file
         """
-        try:
-            from pyvis.network import Network
-        except ImportError:
-            console.print("[red]✗[/red] pyvis not installed. Run: pip install pyvis")
-            return None
-        
-        # Create pyvis network
-        net = Network(
-            height="800px",
-            width="100%",
-            directed=True,
-            notebook=False,
-            bgcolor="#ffffff",
-            font_color="#000000"
-        )
-        
-        # Configure physics for better layout
-        net.set_options("""
-        {
-          "physics": {
-            "enabled": true,
-            "barnesHut": {
-              "gravitationalConstant": -8000,
-              "springLength": 200,
-              "springConstant": 0.04
-            }
-          },
-          "interaction": {
-            "hover": true,
-            "tooltipDelay": 100,
-            "navigationButtons": true,
-            "keyboard": true
-          }
-        }
-        """)
-        
-        # Add nodes with sizing and coloring
-        for node, data in graph.nodes(data=True):
+        # Extract each attribute for all nodes in one pass
+        titles = nx.get_node_attributes(graph, 'title')
+        years = nx.get_node_attributes(graph, 'year')
+        citation_counts = nx.get_node_attributes(graph, 'citation_count')
+        partial_nodes = _partial_nodes(graph)
+        author_strs = nx.get_node_attributes(graph, 'author_str')
+        
+        # Build nodes with sizing and coloring
+        nodes = []
+        log = math.log
+        for node in graph.nodes:
             # Determine node properties
-            title = data.get('title', 'Unknown')
-            year = data.get('year', 'N/A')
-            citations = data.get('citation_count', 0)
-            is_partial = data.get('partial', False)
+            title = titles.get(node, 'Unknown')
+            year = years.get(node, 'N/A')
+            citations = citation_counts.get(node, 0)
+            is_partial = node in partial_nodes
             
             # Size based on citations (log scale)
-            import math
-            size = 10 + math.log(max(citations, 1) + 1) * 5
+            size = 10 + log(max(citations, 1) + 1) * 5
             
             # Color based on year (gradient from blue to red)
             if year and year != 'N/A':
@@ -113,10 +157,7 @@ class GraphVisualizer:
                 size = 8
             
             # Create hover tooltip
-            authors = data.get('authors', [])
-            author_str = ', '.join(authors[:3]) if authors else 'Unknown'
-            if len(authors) > 3:
-                author_str += f' et al. ({len(authors)} total)'
+            author_str = author_strs.get(node) or 'Unknown'
             
             tooltip = f"""
             <b>{title}</b><br>
@@ -129,22 +170,62 @@ class GraphVisualizer:
             # Truncate label for display
             label = title[:40] + '...' if len(title) > 40 else title
             
-            net.add_node(
-                node,
-                label=label,
-                title=tooltip,
-                size=size,
-                color=color,
-                borderWidth=2 if not is_partial else 1
-            )
+            nodes.append({
+                'id': node,
+                'label': label,
+                'title': tooltip,
+                'size': size,
+                'color': color,
+                'borderWidth': 2 if not is_partial else 1
+            })
+        
+        # Only edges between drawn nodes (pyvis's add_edge would reject others)
+        node_ids = {node['id'] for node in nodes}
+        edges = [
+            {'from': source, 'to': target, 'arrows': 'to', 'width': 1, 'color': '#888888'}
+            for source, target in graph.edges()
+            if source in node_ids and target in node_ids
+        ]
         
-        # Add edges
-        for source, target in graph.edges():
-            net.add_edge(source, target, arrows="to", width=1, color="#888888")
-        
-        # Save to file
         output_path = self.output_dir / output_file
-        net.save_graph(str(output_path))
+        
+        if use_pyvis:
+            try:
+                from pyvis.network import Network
+            except ImportError:
+                console.print("[red]✗[/red] pyvis not installed. Run: pip install pyvis")
+                return None
+            
+            # Create pyvis network
+            net = Network(
+                height="800px",
+                width="100%",
+                directed=True,
+                notebook=False,
+                bgcolor="#ffffff",
+                font_color="#000000"
+            )
+            
+            # Configure physics for better layout
+            net.set_options(VIS_OPTIONS)
+            
+            for node in nodes:
+                net.add_node(node.pop('id'), **node)
+            
+            # Edges are already in pyvis's dict format and their endpoints
+            # were checked above, so append them instead of calling add_edge
+            net.edges.extend(edges)
+            
+            # Save to file
+            net.save_graph(str(output_path))
+        else:
+            html = (
+                VIS_TEMPLATE
+                .replace('__NODES__', _to_script_json(nodes))
+                .replace('__EDGES__', _to_script_json(edges))
+                .replace('__OPTIONS__', VIS_OPTIONS.strip())
+            )
+            output_path.write_text(html, encoding='utf-8')
         
         console.print(f"[green]✓[/green] Interactive graph saved: {output_path}")
         
@@ -161,7 +242,8 @@ class GraphVisualizer:
         self,
         graph: nx.DiGraph,
         output_file: str = "citation_network.png",
-        layout: str = "spring"
+        layout: str = "spring",
+        max_nodes: int = 200
     ) -> Optional[Path]:
         """
         Create static image visualization with matplotlib
@@ -170,6 +252,7 @@ class GraphVisualizer:
             graph: NetworkX graph to visualize
             output_file: Output filename
             layout: Layout algorithm ('spring', 'circular', 'kamada_kawai')
+            max_nodes: Maximum number of nodes to draw (highest PageRank first)
             
         Returns:
             Path to generated image file
@@ -180,6 +263,14 @@ class GraphVisualizer:
             console.print("[red]✗[/red] matplotlib not installed")
             return None
         
+        # Layout cost grows quadratically with node count, so large graphs
+        # are reduced to their most central papers
+        if graph.number_of_nodes() > max_nodes:
+            pagerank = nx.pagerank(graph)
+            keep = sorted(pagerank, key=pagerank.get, reverse=True)[:max_nodes]
+            graph = graph.subgraph(keep).copy()
+            console.print(f"[dim]Drawing top {max_nodes} papers by PageRank[/dim]")
+        
         # Create figure
         plt.figure(figsize=(16, 12))
         
@@ -196,17 +287,17 @@ class GraphVisualizer:
         # Prepare node sizes and colors
         node_sizes = []
         node_colors = []
+        partial_nodes = _partial_nodes(graph)
         
+        log = math.log
         for node, data in graph.nodes(data=True):
             citations = data.get('citation_count', 0)
-            is_partial = data.get('partial', False)
             
-            if is_partial:
+            if node in partial_nodes:
                 node_sizes.append(100)
                 node_colors.append('#eeeeee')
             else:
-                import math
-                size = 300 + math.log(max(citations, 1) + 1) * 200
+                size = 300 + log(max(citations, 1) + 1) * 200
                 node_sizes.append(size)
                 
                 year = data.get('year', 2020)
@@ -238,7 +329,7 @@ class GraphVisualizer:
         # Add labels for non-partial nodes
         labels = {}
         for node, data in graph.nodes(data=True):
-            if not data.get('partial', False):
+            if node not in partial_nodes:
                 title = data.get('title', node)
                 labels[node] = title[:20] + '...' if len(title) > 20 else title
         
@@ -286,8 +377,9 @@ class GraphVisualizer:
         console.print("\n[bold]Top Papers by Citations:[/bold]\n")
         
         papers = []
+        partial_nodes = _partial_nodes(graph)
         for node, data in graph.nodes(data=True):
-            if not data.get('partial', False):
+            if node not in partial_nodes:
                 papers.append((
                     node,
                     data.get('title', 'Unknown'),
@@ -296,7 +388,7 @@ class GraphVisualizer:
                     graph.in_degree(node)
                 ))
         
-        papers.sort(key=lambda x: x[2], reverse=True)
+        papers.sort(key=itemgetter(2), reverse=True)
         
         paper_table = Table(show_header=True, header_style="bold magenta")
         paper_table.add_column("#", width=3)
@@ -2,57 +2,377 @@
 Interactive chatbot interface for DeepSci Agent
 """
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.markdown import Markdown
 from rich.table import Table
+from rich.text import Text
 from rich.prompt import Prompt, Confirm
+from rich.live import Live
 from rich import box
 from datetime import datetime
-from typing import List, Optional
+from functools import cached_property, lru_cache
+from itertools import islice
+from operator import attrgetter
+from pathlib import Path
+from sys import intern
+from typing import TYPE_CHECKING, Iterator, List, Optional
+import hashlib
 import re
+import time
 
 from deepsci.sources.arxiv_client import ArxivClient, Paper
-from deepsci.sources.citation_client import CitationClient
-from deepsci.sources.scholar_client import ScholarClient
-from deepsci.sources.pdf_processor import PDFProcessor
-from deepsci.llm.local_llm import LocalLLM, ModelDownloader
-from deepsci.search.vector_store import VectorStore
-from deepsci.analysis.citation_graph import CitationGraph
-from deepsci.analysis.graph_visualizer import GraphVisualizer
+from deepsci.utils.text import ellipsize
 from deepsci import __version__
 
+if TYPE_CHECKING:
+    # Annotations only: llama_cpp / chromadb load when the feature is first used
+    from deepsci.llm.local_llm import LocalLLM
+    from deepsci.search.vector_store import VectorStore
+
+
+# Command patterns as (name, pattern) in priority order. They are joined into
+# one alternation so each input is matched in a single pass; the outer named
+# group that matched (match.lastgroup) identifies the command. Matching is
+# case-insensitive, so inputs never need a lower-cased copy.
+_COMMAND_PATTERNS = (
+    ('search_pdf', r'search pdf\s+(?P<pdf_num>\d+)\s+(?P<pdf_query>.+)'),
+    ('search', r'(?:search|find|look for|show me)\s+(?:papers?\s+)?(?:on|about)?\s*(?P<query>.+)'),
+    ('topic', r'(?:what|papers)\s+(?:about|on)\s+(?P<topic_query>.+)'),
+    ('save', r'save\s+(?P<save_nums>[\d\s]+)'),
+    ('similar', r'similar\s+(?:to\s+)?(?P<similar_num>\d+)'),
+    ('compare', r'compare\s+(?P<compare_nums>[\d\s]+)'),
+    ('download', r'download\s+(?:pdf\s+)?(?P<download_num>\d+)'),
+    ('fulltext', r'fulltext\s+(?P<fulltext_num>\d+)'),
+    ('graph', r'graph\s+(?P<graph_nums>[\d\s]+)'),
+    ('path', r'path\s+(?P<path_from>\d+)\s+(?P<path_to>\d+)'),
+)
+_COMMAND_PATTERN = '(?i)^(?:' + '|'.join(f'(?P<{name}>{pattern})' for name, pattern in _COMMAND_PATTERNS) + ')'
+
+# Prefer RE2 (linear-time, no backtracking) when google-re2 is installed;
+# its leftmost-first alternation matches the stdlib semantics used here
+try:
+    import re2
+    _COMMAND_RE = re2.compile(_COMMAND_PATTERN)
+except Exception:
+    _COMMAND_RE = re.compile(_COMMAND_PATTERN)
+
+# Matched pattern name -> (command, argument groups joined with '|')
+_COMMAND_ARGS = {
+    'search_pdf': ('search_pdf', ('pdf_num', 'pdf_query')),
+    'search': ('search', ('query',)),
+    'topic': ('search', ('topic_query',)),
+    'save': ('save', ('save_nums',)),
+    'similar': ('similar', ('similar_num',)),
+    'compare': ('compare', ('compare_nums',)),
+    'download': ('download_pdf', ('download_num',)),
+    'fulltext': ('fulltext', ('fulltext_num',)),
+    'graph': ('graph', ('graph_nums',)),
+    'path': ('path', ('path_from', 'path_to')),
+}
+
+# Words allowed between "show"/"summarize" and the paper number
+_PAPER_FILLERS = frozenset({'me', 'the', 'paper', 'number', 'no.'})
+_LEADING_NUMBER_RE = re.compile(r'\d+')
+
+# Whole-input keyword commands, resolved with a single dict lookup
+_COMMANDS = {
+    'help': ('help', ''),
+    'help me': ('help', ''),
+    'what can you do': ('help', ''),
+    'commands': ('help', ''),
+    'exit': ('exit', ''),
+    'quit': ('exit', ''),
+    'bye': ('exit', ''),
+    'goodbye': ('exit', ''),
+    'seminal': ('seminal', ''),
+    'seminal papers': ('seminal', ''),
+    'influential': ('seminal', ''),
+    'graph': ('graph', 'all'),
+    'library stats': ('library_stats', ''),
+    'library status': ('library_stats', ''),
+    'citations on': ('citations', 'on'),
+    'citations off': ('citations', 'off'),
+    'refresh': ('refresh', ''),
+}
+# Longer inputs cannot be keyword commands, so they skip the lower() copy
+_COMMANDS_MAX_LEN = max(map(len, _COMMANDS))
+
+# Keyword phrases still honoured when they appear inside a longer input
+_KEYWORD_RE = re.compile(r'(?P<library_stats>library stat(?:s|us))|citations (?P<citations>on|off)', re.IGNORECASE)
+
+_WELCOME_TEXT = """
+# 🔬 Welcome to DeepSci Agent v{version}
+
+Your AI-powered physics research assistant. I can help you:
+
+• **Search** arXiv for physics papers with citation metrics
+• **Compare** multiple papers side-by-side with AI analysis {ai_tag}
+• **Summarize** research papers and extract key findings {ai_tag}
+• **Rank** papers by citation impact and influence
+• **Analyze** full PDF text, not just abstracts
+• **Answer** questions about physics topics
+
+**Quick Commands:**
+- `search <query>` - Search arXiv with citation rankings
+- `show <number>` - Show details of a paper from results
+- `compare <numbers>` - Compare papers (e.g., "compare 1 2 3") {ai_tag}
+- `download <number>` - Download PDF for offline reading
+- `fulltext <number>` - Extract and view full PDF text
+- `search pdf <number> <query>` - Search within a PDF
+- `save <numbers>` - Save papers to your library (e.g., "save 1 2 3")
+- `library search <query>` - Semantic search in your saved papers
+- `similar to <number>` - Find papers similar to one from results
+- `library stats` - Show your library statistics
+- `summarize <number>` - Get AI summary {ai_tag}
+- `help` - Show all commands
+- `exit` - Exit the chat
+
+**Just type naturally!** Try: *"find papers on quantum entanglement"*
+
+**Status:** {ai_status} | Citations: {citations_status}
+
+**💡 Tip:** Download PDFs for full-text analysis beyond abstracts!
+"""
+
+_HELP_TEXT = """
+# Available Commands
+
+## Natural Language (just type!)
+- *"find papers on quantum mechanics"*
+- *"search for dark matter research"*
+- *"what about string theory"*
+
+## Search Commands
+- `search <query>` - Search arXiv for papers
+- `library search <query>` - Semantic search in your saved papers
+- `similar to <number>` - Find papers similar to one from results
+
+## Analysis Commands
+- `show <number>` - Show details of paper from results
+- `summarize <number>` - Get AI summary of a paper (requires AI)
+- `compare <numbers>` - Compare multiple papers (e.g., "compare 1 2 3") (requires AI)
+
+## PDF Commands
+- `download <number>` - Download PDF for offline access
+- `fulltext <number>` - Extract and view full text from PDF
+- `search pdf <number> <query>` - Search for text within a PDF
+
+## Citation Network (NEW!)
+- `graph` - Build citation network for current papers
+- `graph <numbers>` - Build network for specific papers (e.g., "graph 1 2 3")
+- `seminal` - Identify most influential papers in network
+- `path <num1> <num2>` - Find citation path between two papers
+
+## Library Commands
+- `save <numbers>` - Save papers to your library (e.g., "save 1 2 3")
+- `library stats` - Show your library statistics
+
+## Settings
+- `citations on/off` - Enable/disable citation fetching
+- `refresh` - Clear cached search results
+- `help` - Show this help message
+- `exit` - Exit the chat
+"""
+
+# Static start of every comparison prompt: identical tokens each time, so
+# llama.cpp's prefix matching and prompt cache skip re-evaluating them
+_COMPARE_PREFIX = """<|system|>
+You are a research assistant helping to compare scientific papers. Provide clear, structured comparative analysis.
+</s>
+<|user|>
+"""
+
+_RESULTS_HINT = "\n[dim]Type 'show <number>' to see details | Citations with ⭐ are highly influential[/dim]"
+
+# Prompt echoes the model sometimes prefixes to, or leaks into, a comparison
+_RESP_STRIP_RE = re.compile(r'^(?:(?:Write your analysis now:|TASK:|Here is|Analysis:)\s*)+')
+_RESP_BAD_RE = re.compile(r'provide a comparative|covering:|task:', re.IGNORECASE)
+
+# Seconds an identical repeat search re-displays the previous results
+_REPEAT_SEARCH_TTL = 300.0
+
+# Seconds library stats are reused before asking the vector store again
+_STATS_TTL = 5.0
+
+# (header, style, width) for the search results table; None lets Rich size it
+_TABLE_COLUMNS = (
+    ("#", "dim", 3),
+    ("Title", "bold", None),
+    ("Authors", "green", None),
+    ("Year", "blue", 6),
+    ("Citations", "yellow", 10),
+    ("Source", "cyan", 8),
+)
+
+
+def _year_of(paper) -> str:
+    """Publication year for display"""
+    year = getattr(paper, 'year', None)
+    return str(year) if year else 'N/A'
+
+
+def _response_key(kind: str, *parts: str) -> str:
+    """Stable cache key for an AI response over the given inputs"""
+    return hashlib.sha256("\x1f".join((kind,) + parts).encode()).hexdigest()
+
+
+@lru_cache(maxsize=8)
+def _build_welcome_panel(use_llm: bool, ai_ready: bool, citations: bool, version: str) -> Panel:
+    """Welcome panel; it only varies with these flags, so parse each variant once"""
+    welcome_text = _WELCOME_TEXT.format(
+        version=version,
+        ai_tag=' 🤖' if use_llm else ' (requires AI)',
+        ai_status="✓ AI Enabled" if ai_ready else "⊘ AI Disabled",
+        citations_status='✓ Enabled' if citations else '⊘ Disabled'
+    )
+    return Panel(
+        Markdown(welcome_text),
+        title="DeepSci Agent",
+        border_style="cyan",
+        box=box.DOUBLE
+    )
+
+
+@lru_cache(maxsize=512)
+def _cached_strftime(year: int, month: int, day: int, fmt: str) -> str:
+    return datetime(year, month, day).strftime(fmt)
+
+
+def _format_date(value: Optional[datetime], fmt: str) -> str:
+    """Format a date, reusing results for dates already seen (day precision)"""
+    if value is None:
+        return 'N/A'
+    return _cached_strftime(value.year, value.month, value.day, fmt)
+
+
+def _published_of(paper, fmt: str) -> str:
+    """Publication date for display, or just the year when that is all we know"""
+    if paper.published is None:
+        return _year_of(paper)
+    return _format_date(paper.published, fmt)
+
+
+def _library_paper(record: dict) -> Paper:
+    """
+    Rebuild a Paper from a vector store result
+    
+    Author and category strings are interned, since saved papers share
+    them heavily and every library/similar query rebuilds the objects.
+    
+    Args:
+        record: Paper dictionary returned by VectorStore.search/find_similar
+    """
+    paper = Paper(
+        id=record.get('id', ''),
+        title=record.get('title', ''),
+        authors=[intern(author) for author in record.get('authors', [])],
+        abstract=record.get('abstract', ''),
+        published=None,
+        updated=None,
+        url=record.get('url', ''),
+        pdf_url=record.get('url', ''),
+        categories=[intern(category) for category in record.get('categories', [])],
+        citation_count=int(record.get('citation_count', 0)),
+        source=record.get('source', 'library'),
+        similarity=record.get('similarity', 0)
+    )
+    # Only the year is stored in the library
+    year = str(record.get('year', ''))
+    paper.year = int(year) if year.isdigit() else None
+    return paper
+
+
+def _cite_str(paper) -> str:
+    """Citation count, with highly influential citations starred"""
+    cited = paper.citation_count
+    influential = paper.influential_citations
+    return f"{cited} ({influential}⭐)" if influential > 0 else str(cited)
+
 
 class DeepSciChat:
     """Interactive chatbot interface for research assistance"""
     
     def __init__(self, use_llm: bool = True):
-        self.console = Console()
+        # All output is styled explicitly, so skip Rich's regex highlighters
+        self.console = Console(highlight=False)
         self.arxiv_client = ArxivClient(max_results=10)
-        self.citation_client = CitationClient()
-        self.scholar_client = ScholarClient()
-        self.pdf_processor = PDFProcessor()
         self.citation_graph = None  # Initialize on demand
-        self.graph_visualizer = GraphVisualizer()
-        self.vector_store = None  # Initialize lazily on first use
+        self.vector_store: Optional["VectorStore"] = None  # Initialize lazily on first use
         self.conversation_history = []
         self.current_papers = []
-        self.llm = None
+        self.llm: Optional["LocalLLM"] = None
         self.use_llm = use_llm
         self.fetch_citations = True  # Enable citations by default
+        self._help_panel = None  # Built on first 'help'
+        self._last_search = None  # (query key, monotonic time, ranked papers)
+        self._pdf_paths = {}  # paper id -> local PDF path
+        self._stats_cache = None  # (monotonic time, vector store stats)
+        
+        # Command name -> handler taking the argument string ('exit' is
+        # handled by the loop itself)
+        self._handlers = {
+            'help': lambda args: self.show_help(),
+            'search': self._require_args(self.handle_search),
+            'show': self._require_papers(self.handle_show, "No papers to show. Search for papers first."),
+            'summarize': self._require_papers(self.handle_summarize, "No papers to summarize. Search for papers first."),
+            'save': self.handle_save,
+            'library_search': self._require_args(self.handle_library_search),
+            'similar': self.handle_similar,
+            'compare': self.handle_compare,
+            'download_pdf': self.handle_download_pdf,
+            'fulltext': self.handle_fulltext,
+            'search_pdf': self.handle_search_pdf,
+            'graph': self.handle_graph,
+            'seminal': self.handle_seminal,
+            'path': self.handle_path,
+            'library_stats': lambda args: self.handle_library_stats(),
+            'citations': self.handle_citations,
+            'refresh': self.handle_refresh,
+        }
         
         # Initialize LLM if requested
         if self.use_llm:
             self._initialize_llm()
         
+    @cached_property
+    def citation_client(self):
+        """Semantic Scholar client, created on first use"""
+        from deepsci.sources.citation_client import CitationClient
+        return CitationClient()
+    
+    @cached_property
+    def llm_cache(self):
+        """On-disk cache of AI responses (the citation cache is a generic JSON TTL store)"""
+        from deepsci.sources.citation_cache import CitationCache
+        return CitationCache(cache_file="./data/llm_cache.json", cache_days=30)
+    
+    @cached_property
+    def scholar_client(self):
+        """Google Scholar client, created on first use"""
+        from deepsci.sources.scholar_client import ScholarClient
+        return ScholarClient()
+    
+    @cached_property
+    def pdf_processor(self):
+        """PDF downloader/extractor, created on first use"""
+        from deepsci.sources.pdf_processor import PDFProcessor
+        return PDFProcessor()
+    
+    @cached_property
+    def graph_visualizer(self):
+        """Citation graph renderer, created on first use"""
+        from deepsci.analysis.graph_visualizer import GraphVisualizer
+        return GraphVisualizer()
+    
     def _initialize_llm(self):
         """Initialize the local LLM"""
         try:
             self.console.print("\n[cyan]Initializing AI assistant...[/cyan]")
             
-            # Check if model exists
-            downloader = ModelDownloader()
-            model_path = downloader.models_dir / "tinyllama-1.1b-chat-v1.0.Q4_K_M.gguf"
+            # Check if model exists (a plain path check, so llama.cpp is
+            # only imported once the user has agreed to load the model)
+            model_path = Path("./models") / "tinyllama-1.1b-chat-v1.0.Q4_K_M.gguf"
             
             if not model_path.exists():
                 self.console.print("[yellow]First time setup: Downloading AI model (669MB)[/yellow]")
@@ -63,6 +383,7 @@ class DeepSciChat:
                     self.use_llm = False
                     return
             
+            from deepsci.llm.local_llm import LocalLLM
             self.llm = LocalLLM()
             self.console.print("[green]✓[/green] AI assistant ready!\n")
             
@@ -76,54 +397,32 @@ class DeepSciChat:
         if self.vector_store is None:
             try:
                 self.console.print("[cyan]Loading vector search...[/cyan]")
+                from deepsci.search.vector_store import VectorStore
                 self.vector_store = VectorStore()
-                stats = self.vector_store.get_stats()
+                stats = self._library_stats()
                 self.console.print(f"[green]✓[/green] Library loaded: {stats['total_papers']} papers")
             except Exception as e:
                 self.console.print(f"[yellow]Warning: Could not load vector store: {str(e)}[/yellow]")
     
-    def show_welcome(self):
-        """Display welcome message"""
-        ai_status = "✓ AI Enabled" if (self.use_llm and self.llm) else "⊘ AI Disabled"
+    def _library_stats(self) -> dict:
+        """
+        Vector store stats, reused for a few seconds between commands
         
-        welcome_text = f"""
-# 🔬 Welcome to DeepSci Agent v{__version__}
-
-Your AI-powered physics research assistant. I can help you:
-
-• **Search** arXiv for physics papers with citation metrics
-• **Compare** multiple papers side-by-side with AI analysis {' 🤖' if self.use_llm else ' (requires AI)'}
-• **Summarize** research papers and extract key findings {' 🤖' if self.use_llm else ' (requires AI)'}
-• **Rank** papers by citation impact and influence
-• **Analyze** full PDF text, not just abstracts
-• **Answer** questions about physics topics
-
-**Quick Commands:**
-- `search <query>` - Search arXiv with citation rankings
-- `show <number>` - Show details of a paper from results
-- `compare <numbers>` - Compare papers (e.g., "compare 1 2 3") {' 🤖' if self.use_llm else ' (requires AI)'}
-- `download <number>` - Download PDF for offline reading
-- `fulltext <number>` - Extract and view full PDF text
-- `search pdf <number> <query>` - Search within a PDF
-- `save <numbers>` - Save papers to your library (e.g., "save 1 2 3")
-- `library search <query>` - Semantic search in your saved papers
-- `similar to <number>` - Find papers similar to one from results
-- `library stats` - Show your library statistics
-- `summarize <number>` - Get AI summary {' 🤖' if self.use_llm else ' (requires AI)'}
-- `help` - Show all commands
-- `exit` - Exit the chat
-
-**Just type naturally!** Try: *"find papers on quantum entanglement"*
-
-**Status:** {ai_status} | Citations: {'✓ Enabled' if self.fetch_citations else '⊘ Disabled'}
-
-**💡 Tip:** Download PDFs for full-text analysis beyond abstracts!
+        The cache is dropped whenever papers are saved, so counts shown
+        after a save are always current.
         """
-        self.console.print(Panel(
-            Markdown(welcome_text),
-            title="DeepSci Agent",
-            border_style="cyan",
-            box=box.DOUBLE
+        now = time.monotonic()
+        if self._stats_cache is None or now - self._stats_cache[0] >= _STATS_TTL:
+            self._stats_cache = (now, self.vector_store.get_stats())
+        return self._stats_cache[1]
+    
+    def show_welcome(self):
+        """Display welcome message"""
+        self.console.print(_build_welcome_panel(
+            self.use_llm,
+            bool(self.use_llm and self.llm),
+            self.fetch_citations,
+            __version__
         ))
     
     def parse_command(self, user_input: str) -> tuple[str, str]:
@@ -135,103 +434,43 @@ Your AI-powered physics research assistant. I can help you:
         
         # Check for explicit commands
         if user_input.startswith('/'):
-            parts = user_input[1:].split(' ', 1)
-            cmd = parts[0].lower()
-            args = parts[1] if len(parts) > 1 else ""
-            return cmd, args
-        
-        # Natural language parsing
-        lower_input = user_input.lower()
-        
-        # Search patterns
-        search_patterns = [
-            r'^(?:search|find|look for|show me)\s+(?:papers?\s+)?(?:on|about)?\s*(.+)',
-            r'^(?:what|papers)\s+(?:about|on)\s+(.+)',
-        ]
-        
-        for pattern in search_patterns:
-            match = re.match(pattern, lower_input)
-            if match:
-                return 'search', match.group(1).strip()
+            cmd, _, args = user_input[1:].partition(' ')
+            return cmd.lower(), args
         
-        # Show paper details
-        if re.match(r'^show\s+(?:paper\s+)?(\d+)', lower_input):
-            match = re.match(r'^show\s+(?:paper\s+)?(\d+)', lower_input)
-            return 'show', match.group(1)
+        # Natural language parsing (case-insensitive; only short pieces are
+        # lower-cased, never the whole input)
         
-        # Summarize patterns
-        if re.match(r'^summarize\s+(?:paper\s+)?(\d+)', lower_input):
-            match = re.match(r'^summarize\s+(?:paper\s+)?(\d+)', lower_input)
-            return 'summarize', match.group(1)
+        # Keyword commands
+        if len(user_input) <= _COMMANDS_MAX_LEN:
+            command = _COMMANDS.get(user_input.lower())
+            if command:
+                return command
         
-        # Save papers
-        if re.match(r'^save\s+([\d\s]+)', lower_input):
-            match = re.match(r'^save\s+([\d\s]+)', lower_input)
-            return 'save', match.group(1)
+        # Show / summarize paper: "show 3", "summarize paper 3 please",
+        # "show me paper 3"; the number is the first non-filler token
+        tokens = user_input.split()
+        if len(tokens) > 1:
+            verb = tokens[0].lower()
+            if verb in {'show', 'summarize'}:
+                token = next((t for t in tokens[1:] if t.lower() not in _PAPER_FILLERS), '')
+                if (number := _LEADING_NUMBER_RE.match(token)):
+                    return verb, number.group()
         
         # Library search
-        if lower_input.startswith('library search '):
-            return 'library_search', lower_input[15:].strip()
-        
-        # Similar papers
-        if re.match(r'^similar\s+(?:to\s+)?(\d+)', lower_input):
-            match = re.match(r'^similar\s+(?:to\s+)?(\d+)', lower_input)
-            return 'similar', match.group(1)
-        
-        # Compare papers
-        if re.match(r'^compare\s+([\d\s]+)', lower_input):
-            match = re.match(r'^compare\s+([\d\s]+)', lower_input)
-            return 'compare', match.group(1)
-        
-        # PDF download
-        if re.match(r'^download\s+(?:pdf\s+)?(\d+)', lower_input):
-            match = re.match(r'^download\s+(?:pdf\s+)?(\d+)', lower_input)
-            return 'download_pdf', match.group(1)
+        if user_input[:15].lower() == 'library search ':
+            return 'library_search', user_input[15:].strip()
         
-        # PDF full text
-        if re.match(r'^fulltext\s+(\d+)', lower_input):
-            match = re.match(r'^fulltext\s+(\d+)', lower_input)
-            return 'fulltext', match.group(1)
+        # Natural-language search and numbered commands, in one regex pass
+        if (match := _COMMAND_RE.match(user_input)):
+            cmd, groups = _COMMAND_ARGS[match.lastgroup]
+            return cmd, '|'.join(match.group(group).strip() for group in groups)
         
-        # Search in PDF
-        if re.match(r'^search pdf\s+(\d+)\s+(.+)', lower_input):
-            match = re.match(r'^search pdf\s+(\d+)\s+(.+)', lower_input)
-            return 'search_pdf', f"{match.group(1)}|{match.group(2)}"
-        
-        # Library stats
-        if 'library stats' in lower_input or 'library status' in lower_input:
+        # Library stats / citations toggle mentioned anywhere, in one scan
+        if (match := _KEYWORD_RE.search(user_input)):
+            if match.lastgroup == 'citations':
+                return 'citations', match.group('citations').lower()
             return 'library_stats', ''
         
-        # Citation graph commands
-        if re.match(r'^graph\s+([\d\s]+)', lower_input):
-            match = re.match(r'^graph\s+([\d\s]+)', lower_input)
-            return 'graph', match.group(1)
-        if lower_input == 'graph':
-            return 'graph', 'all'
-        
-        # Seminal papers
-        if lower_input in ['seminal', 'seminal papers', 'influential']:
-            return 'seminal', ''
-        
-        # Citation path
-        if re.match(r'^path\s+(\d+)\s+(\d+)', lower_input):
-            match = re.match(r'^path\s+(\d+)\s+(\d+)', lower_input)
-            return 'path', f"{match.group(1)}|{match.group(2)}"
-        
-        # Citations toggle
-        if 'citations on' in lower_input:
-            return 'citations', 'on'
-        if 'citations off' in lower_input:
-            return 'citations', 'off'
-        
-        # Help patterns
-        if lower_input in ['help', 'help me', 'what can you do', 'commands']:
-            return 'help', ''
-        
-        # Exit patterns
-        if lower_input in ['exit', 'quit', 'bye', 'goodbye']:
-            return 'exit', ''
-        
         # Default: treat as search
         if len(user_input) > 3:
             return 'search', user_input
@@ -246,6 +485,17 @@ Your AI-powered physics research assistant. I can help you:
         
         self.current_papers = papers
         
+        self.console.print(self._build_papers_table(papers))
+        self.console.print(_RESULTS_HINT)
+    
+    def _build_papers_table(self, papers: List[Paper], pending: Optional[set] = None) -> Table:
+        """
+        Build the search results table
+        
+        Args:
+            papers: Papers to list
+            pending: ids of papers whose citation counts are still loading
+        """
         table = Table(
             title=f"Found {len(papers)} papers",
             box=box.ROUNDED,
@@ -254,141 +504,103 @@ Your AI-powered physics research assistant. I can help you:
             padding=(1, 2)  # Add vertical and horizontal padding
         )
         
-        table.add_column("#", style="dim", width=3)
-        table.add_column("Title", style="bold")
-        table.add_column("Authors", style="green")
-        table.add_column("Year", style="blue", width=6)
-        table.add_column("Citations", style="yellow", width=10)
-        table.add_column("Source", style="cyan", width=8)
+        for header, style, width in _TABLE_COLUMNS:
+            table.add_column(header, style=style, width=width)
         
-        for idx, paper in enumerate(papers, 1):
-            authors = ", ".join(paper.authors[:2])
-            if len(paper.authors) > 2:
-                authors += f" et al."
-            
-            # Truncate title if too long
-            title = paper.title if len(paper.title) <= 80 else paper.title[:77] + "..."
-            
-            # Get year from paper
-            if hasattr(paper, 'published') and paper.published:
-                year = str(paper.published.year)
-            else:
-                # For PubMed papers, extract year from published_date string
-                year = getattr(paper, 'published_date', 'N/A')
-                if isinstance(year, str) and '-' in year:
-                    year = year.split('-')[0]
-            
-            # Citation count
-            citations = str(getattr(paper, 'citation_count', 0))
-            if hasattr(paper, 'influential_citations') and paper.influential_citations > 0:
-                citations += f" ({paper.influential_citations}⭐)"
-            
-            # Source
-            source = getattr(paper, 'source', 'unknown').upper()
-            
-            table.add_row(
+        pending = pending or ()
+        rows = [
+            (
                 str(idx),
-                title,
-                authors,
-                year,
-                citations,
-                source
+                paper.short_title,
+                paper.short_authors,
+                _year_of(paper),
+                "…" if paper.id in pending else _cite_str(paper),
+                paper.source.upper()
             )
+            for idx, paper in enumerate(papers, 1)
+        ]
+        
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
         
-        self.console.print(table)
-        self.console.print("\n[dim]Type 'show <number>' to see details | Citations with ⭐ are highly influential[/dim]")
+        return table
     
     def display_paper_details(self, paper: Paper):
         """Display detailed information about a single paper"""
-        details = f"""
-## {paper.title}
-
-**Authors:** {', '.join(paper.authors)}
-
-**Published:** {paper.published.strftime('%B %d, %Y')}
-
-**Categories:** {', '.join(paper.categories)}
-
-**arXiv ID:** {paper.id}
-
-**URL:** {paper.url}
-
-### Abstract
-{paper.abstract}
-        """
+        # Styled directly rather than through Markdown: the layout is fixed,
+        # and abstracts often contain '*' or '_' that Markdown would mangle
+        details = Text.assemble(
+            (" ".join(paper.title.split()), "bold"), "\n\n",
+            ("Authors: ", "bold"), ", ".join(paper.authors), "\n\n",
+            ("Published: ", "bold"), _published_of(paper, '%B %d, %Y'), "\n\n",
+            ("Categories: ", "bold"), ", ".join(paper.categories), "\n\n",
+            ("arXiv ID: ", "bold"), paper.id, "\n\n",
+            ("URL: ", "bold"), paper.url, "\n\n",
+            ("Abstract", "bold underline"), "\n",
+            " ".join(paper.abstract.split())
+        )
         
         self.console.print(Panel(
-            Markdown(details),
-            title=f"Paper Details",
+            details,
+            title="Paper Details",
             border_style="green",
             box=box.ROUNDED
         ))
     
     def show_help(self):
         """Display help information"""
-        help_text = """
-# Available Commands
-
-## Natural Language (just type!)
-- *"find papers on quantum mechanics"*
-- *"search for dark matter research"*
-- *"what about string theory"*
-
-## Search Commands
-- `search <query>` - Search arXiv for papers
-- `library search <query>` - Semantic search in your saved papers
-- `similar to <number>` - Find papers similar to one from results
-
-## Analysis Commands
-- `show <number>` - Show details of paper from results
-- `summarize <number>` - Get AI summary of a paper (requires AI)
-- `compare <numbers>` - Compare multiple papers (e.g., "compare 1 2 3") (requires AI)
-
-## PDF Commands
-- `download <number>` - Download PDF for offline access
-- `fulltext <number>` - Extract and view full text from PDF
-- `search pdf <number> <query>` - Search for text within a PDF
-
-## Citation Network (NEW!)
-- `graph` - Build citation network for current papers
-- `graph <numbers>` - Build network for specific papers (e.g., "graph 1 2 3")
-- `seminal` - Identify most influential papers in network
-- `path <num1> <num2>` - Find citation path between two papers
-
-## Library Commands
-- `save <numbers>` - Save papers to your library (e.g., "save 1 2 3")
-- `library stats` - Show your library statistics
-
-## Settings
-- `citations on/off` - Enable/disable citation fetching
-- `help` - Show this help message
-- `exit` - Exit the chat
-        """
-        self.console.print(Panel(
-            Markdown(help_text),
-            title="Help",
-            border_style="yellow"
-        ))
+        # The help text never changes, so parse the markdown only once
+        if self._help_panel is None:
+            self._help_panel = Panel(
+                Markdown(_HELP_TEXT),
+                title="Help",
+                border_style="yellow"
+            )
+        self.console.print(self._help_panel)
     
     def handle_search(self, query: str):
         """Handle search command for arXiv"""
         self.console.print(f"\n[cyan]🔍 Searching arXiv:[/cyan] {query}\n")
         
+        # Repeating the last search re-shows its ranked results without
+        # going back to arXiv or Semantic Scholar. The key is case-sensitive
+        # because arXiv boolean operators (AND/OR) are.
+        key = (query.strip(), self.fetch_citations)
+        last = self._last_search
+        if last and last[0] == key and time.monotonic() - last[1] < _REPEAT_SEARCH_TTL:
+            self.display_papers(last[2])
+            return
+        
         try:
-            with self.console.status("[bold cyan]Searching arXiv and fetching citations...", spinner="dots"):
-                papers = self.arxiv_client.search(
-                    query, 
-                    fetch_citations=self.fetch_citations
-                )
-            
-            if papers:
-                # Sort by citations if available
-                if self.fetch_citations:
-                    papers.sort(key=lambda p: getattr(p, 'citation_count', 0), reverse=True)
+            papers = []
+            pending = set()
+            
+            # Render rows as arXiv returns them, then fill in citations
+            with Live(Text("Searching arXiv...", style="bold cyan"), console=self.console, refresh_per_second=8) as live:
+                for paper in self.arxiv_client.iter_search(query):
+                    papers.append(paper)
+                    if self.fetch_citations:
+                        pending.add(paper.id)
+                    live.update(self._build_papers_table(papers, pending))
                 
-                self.console.print(f"[green]✓[/green] Found {len(papers)} papers from arXiv")
+                if not papers:
+                    live.update(Text("No papers found.", style="yellow"))
+                    return
+                
+                if self.fetch_citations:
+                    for paper in self.arxiv_client.iter_citations(papers):
+                        pending.discard(paper.id)
+                        live.update(self._build_papers_table(papers, pending))
+                    
+                    # Sort by citations once all counts are in
+                    papers.sort(key=attrgetter('citation_count'), reverse=True)
+                    live.update(self._build_papers_table(papers))
             
-            self.display_papers(papers)
+            self.current_papers = papers
+            self._last_search = (key, time.monotonic(), papers)
+            self.console.print(f"[green]✓[/green] Found {len(papers)} papers from arXiv")
+            self.console.print(_RESULTS_HINT)
             
         except Exception as e:
             error_msg = str(e)
@@ -430,16 +642,32 @@ Your AI-powered physics research assistant. I can help you:
             
             self.console.print(f"\n[cyan]🤖 Generating AI summary for:[/cyan] {paper.title}\n")
             
-            with self.console.status("[bold cyan]AI is analyzing the paper...", spinner="dots"):
-                summary = self.llm.summarize_abstract(paper.title, paper.abstract)
-                key_points = self.llm.extract_key_points(paper.title, paper.abstract)
+            # Inference dominates; reuse earlier summaries of the same paper
+            cache_key = _response_key('summary', paper.id, paper.title, paper.abstract)
+            cached = self.llm_cache.get(cache_key)
+            if cached:
+                summary, key_points = cached['summary'], cached['key_points']
+            else:
+                # Show tokens as they arrive instead of a spinner for the whole run
+                summary = self._stream_to_panel(
+                    self.llm.summarize_abstract(paper.title, paper.abstract, stream=True),
+                    title="AI-Powered Summary",
+                    border_style="magenta"
+                )
+                key_points = self._stream_to_panel(
+                    self.llm.extract_key_points(paper.title, paper.abstract, stream=True),
+                    title="AI-Powered Summary",
+                    border_style="magenta",
+                    lead=summary + "\n\n"
+                )
+                self.llm_cache.set(cache_key, {'summary': summary, 'key_points': key_points})
             
             summary_text = f"""
 ## {paper.title}
 
 **Authors:** {', '.join(paper.authors[:5])}{'...' if len(paper.authors) > 5 else ''}
 
-**Published:** {paper.published.strftime('%B %Y')}
+**Published:** {_published_of(paper, '%B %Y')}
 
 ### 🤖 AI Summary
 {summary}
@@ -463,6 +691,29 @@ Your AI-powered physics research assistant. I can help you:
         except Exception as e:
             self.console.print(f"[red]Error generating summary:[/red] {str(e)}")
     
+    def _stream_to_panel(self, chunks: Iterator[str], title: str, border_style: str, lead: str = "") -> str:
+        """
+        Render LLM output in a live panel while it is being generated
+        
+        The live view shows plain text (Markdown is only parsed for the
+        final panel) and is transient, so callers print the result.
+        
+        Args:
+            chunks: Text fragments from LocalLLM.generate_stream
+            title: Panel title
+            border_style: Panel border style
+            lead: Earlier output to keep shown above the new text
+            
+        Returns:
+            The complete generated text, stripped
+        """
+        text = ""
+        with Live(console=self.console, refresh_per_second=10, transient=True) as live:
+            for chunk in chunks:
+                text += chunk
+                live.update(Panel(Text(lead + text), title=title, border_style=border_style, box=box.ROUNDED))
+        return text.strip()
+    
     def handle_save(self, paper_numbers: str):
         """Handle save papers to library command"""
         self._initialize_vector_store()
@@ -476,15 +727,17 @@ Your AI-powered physics research assistant. I can help you:
             return
         
         try:
-            # Parse paper numbers
-            numbers = [int(n.strip()) for n in paper_numbers.split()]
+            # Parse paper numbers, validating the whole batch at once
+            numbers = list(map(int, paper_numbers.split()))
+            total = len(self.current_papers)
+            if numbers and (min(numbers) < 1 or max(numbers) > total):
+                for num in numbers:
+                    if not 1 <= num <= total:
+                        self.console.print(f"[yellow]Skipping invalid number: {num}[/yellow]")
+                numbers = [num for num in numbers if 1 <= num <= total]
             
-            saved_count = 0
-            for num in numbers:
-                if num < 1 or num > len(self.current_papers):
-                    self.console.print(f"[yellow]Skipping invalid number: {num}[/yellow]")
-                    continue
-                
+            to_save = []
+            for num in dict.fromkeys(numbers):  # Each paper once, in the given order
                 paper = self.current_papers[num - 1]
                 
                 # Check if already exists
@@ -493,23 +746,28 @@ Your AI-powered physics research assistant. I can help you:
                     continue
                 
                 # Convert Paper object to dict
-                paper_dict = {
+                to_save.append((num, paper, {
                     'id': paper.id,
                     'title': paper.title,
                     'abstract': paper.abstract,
                     'authors': paper.authors,
-                    'year': paper.published.year if hasattr(paper, 'published') else '',
-                    'categories': getattr(paper, 'categories', []),
-                    'citation_count': getattr(paper, 'citation_count', 0),
-                    'url': getattr(paper, 'url', '')
-                }
-                
-                if self.vector_store.add_paper(paper_dict):
-                    saved_count += 1
+                    'year': paper.year or '',
+                    'categories': paper.categories,
+                    'citation_count': paper.citation_count or 0,
+                    'url': paper.url
+                }))
+            
+            # One batched embedding pass and insert for all new papers
+            saved_ids = set(self.vector_store.add_papers([paper_dict for _, _, paper_dict in to_save])) if to_save else set()
+            for num, paper, _ in to_save:
+                if paper.id in saved_ids:
                     self.console.print(f"[green]✓[/green] Saved paper {num}: {paper.title[:60]}...")
+                else:
+                    self.console.print(f"[red]✗[/red] Could not save paper {num}: {paper.title[:60]}...")
             
-            if saved_count > 0:
-                stats = self.vector_store.get_stats()
+            if saved_ids:
+                self._stats_cache = None  # Library changed
+                stats = self._library_stats()
                 self.console.print(f"\n[cyan]Library now has {stats['total_papers']} papers[/cyan]")
             
         except ValueError:
@@ -525,7 +783,7 @@ Your AI-powered physics research assistant. I can help you:
             self.console.print("[red]Error:[/red] Vector store not available")
             return
         
-        stats = self.vector_store.get_stats()
+        stats = self._library_stats()
         if stats['total_papers'] == 0:
             self.console.print("[yellow]Your library is empty. Save some papers first![/yellow]")
             self.console.print("[dim]Use 'save <number>' after searching for papers[/dim]")
@@ -539,22 +797,7 @@ Your AI-powered physics research assistant. I can help you:
             
             if papers:
                 self.console.print(f"[green]✓[/green] Found {len(papers)} relevant papers")
-                # Convert dict to Paper-like objects
-                self.current_papers = []
-                for p in papers:
-                    paper_obj = Paper(
-                        id=p.get('id', ''),
-                        title=p.get('title', ''),
-                        authors=p.get('authors', []),
-                        published=p.get('year', ''),
-                        summary=p.get('abstract', ''),
-                        pdf_url=p.get('url', ''),
-                        categories=p.get('categories', [])
-                    )
-                    # Add citation count if available
-                    paper_obj.citation_count = int(p.get('citation_count', 0))
-                    paper_obj.similarity = p.get('similarity', 0)
-                    self.current_papers.append(paper_obj)
+                self.current_papers = [_library_paper(p) for p in papers]
                 self.display_papers(self.current_papers)
             else:
                 self.console.print("[yellow]No matching papers found in your library[/yellow]")
@@ -581,7 +824,7 @@ Your AI-powered physics research assistant. I can help you:
                 return
             
             paper = self.current_papers[num - 1]
-            paper_id = paper.id if hasattr(paper, 'id') else None
+            paper_id = paper.id
             
             if not paper_id:
                 self.console.print("[red]Error:[/red] Could not get paper ID")
@@ -601,22 +844,7 @@ Your AI-powered physics research assistant. I can help you:
             
             if similar_papers:
                 self.console.print(f"[green]✓[/green] Found {len(similar_papers)} similar papers")
-                # Convert dict to Paper-like objects
-                self.current_papers = []
-                for p in similar_papers:
-                    paper_obj = Paper(
-                        id=p.get('id', ''),
-                        title=p.get('title', ''),
-                        authors=p.get('authors', []),
-                        published=p.get('year', ''),
-                        summary=p.get('abstract', ''),
-                        pdf_url=p.get('url', ''),
-                        categories=p.get('categories', [])
-                    )
-                    # Add citation count if available
-                    paper_obj.citation_count = int(p.get('citation_count', 0))
-                    paper_obj.similarity = p.get('similarity', 0)
-                    self.current_papers.append(paper_obj)
+                self.current_papers = [_library_paper(p) for p in similar_papers]
                 self.display_papers(self.current_papers)
             else:
                 self.console.print("[yellow]No similar papers found in library[/yellow]")
@@ -628,40 +856,50 @@ Your AI-powered physics research assistant. I can help you:
     
     def _generate_simple_comparison(self, papers: List[Paper]) -> str:
         """Generate a simple rule-based comparison as fallback"""
-        analysis = "**Overview:**\n"
-        analysis += f"Comparing {len(papers)} papers on related topics.\n\n"
+        lines = [
+            "**Overview:**",
+            f"Comparing {len(papers)} papers on related topics.\n",
+            "**Papers:**"
+        ]
         
-        analysis += "**Papers:**\n"
-        for i, paper in enumerate(papers, 1):
-            year = paper.published.year if hasattr(paper.published, 'year') else str(paper.published)[:4]
-            citations = paper.citation_count if paper.citation_count > 0 else 0
-            analysis += f"{i}. *{paper.title[:60]}...* ({year}, {citations} citations)\n"
+        # One pass collects the listing and every aggregate used below
+        min_year = max_year = None
+        oldest_idx = 0
+        max_citations = 0
+        most_cited_idx = 0
+        all_authors = set()
+        for i, paper in enumerate(papers):
+            year = paper.year  # Parsed once when the Paper was built
+            citations = paper.citation_count
+            lines.append(f"{i + 1}. *{paper.title[:60]}...* ({year or 'N/A'}, {max(citations, 0)} citations)")
+            
+            if year is not None:
+                if min_year is None or year < min_year:
+                    min_year, oldest_idx = year, i
+                if max_year is None or year > max_year:
+                    max_year = year
+            if citations > max_citations:
+                max_citations, most_cited_idx = citations, i
+            all_authors.update(paper.authors)
         
-        analysis += "\n**Basic Comparison:**\n"
+        lines.append("\n**Basic Comparison:**")
         
         # Compare by year
-        years = [p.published.year if hasattr(p.published, 'year') else int(str(p.published)[:4]) for p in papers]
-        if max(years) - min(years) > 2:
-            analysis += f"- Time span: {max(years) - min(years)} years ({min(years)}-{max(years)})\n"
+        if min_year is not None and max_year - min_year > 2:
+            lines.append(f"- Time span: {max_year - min_year} years ({min_year}-{max_year})")
         
         # Compare by citations
-        citations = [p.citation_count for p in papers]
-        if max(citations) > 0:
-            most_cited = papers[citations.index(max(citations))]
-            analysis += f"- Most cited: Paper {citations.index(max(citations)) + 1} ({max(citations)} citations)\n"
+        if max_citations > 0:
+            lines.append(f"- Most cited: Paper {most_cited_idx + 1} ({max_citations} citations)")
         
         # Common authors
-        all_authors = set()
-        for p in papers:
-            all_authors.update(p.authors)
-        analysis += f"- Total unique authors: {len(all_authors)}\n"
+        lines.append(f"- Total unique authors: {len(all_authors)}")
         
-        analysis += "\n**Recommendation:**\n"
+        lines.append("\n**Recommendation:**")
         # Recommend reading order by year (oldest first for foundational)
-        oldest_idx = years.index(min(years))
-        analysis += f"Start with Paper {oldest_idx + 1} ({min(years)}) for foundational concepts.\n"
+        lines.append(f"Start with Paper {oldest_idx + 1} ({min_year or 'N/A'}) for foundational concepts.")
         
-        return analysis
+        return "\n".join(lines) + "\n"
     
     def handle_compare(self, paper_numbers: str):
         """Handle paper comparison command"""
@@ -676,7 +914,7 @@ Your AI-powered physics research assistant. I can help you:
         
         try:
             # Parse paper numbers
-            numbers = [int(n.strip()) for n in paper_numbers.split()]
+            numbers = list(map(int, paper_numbers.split()))
             
             if len(numbers) < 2:
                 self.console.print("[yellow]Please specify at least 2 papers to compare (e.g., 'compare 1 2')[/yellow]")
@@ -686,13 +924,13 @@ Your AI-powered physics research assistant. I can help you:
                 self.console.print("[yellow]Comparing more than 4 papers at once may be slow. Using first 4...[/yellow]")
                 numbers = numbers[:4]
             
-            # Validate paper numbers
-            papers_to_compare = []
-            for num in numbers:
-                if num < 1 or num > len(self.current_papers):
-                    self.console.print(f"[yellow]Invalid paper number: {num}[/yellow]")
-                    return
-                papers_to_compare.append(self.current_papers[num - 1])
+            # Validate paper numbers (one min/max check for the whole batch)
+            total = len(self.current_papers)
+            if min(numbers) < 1 or max(numbers) > total:
+                invalid = next(num for num in numbers if not 1 <= num <= total)
+                self.console.print(f"[yellow]Invalid paper number: {invalid}[/yellow]")
+                return
+            papers_to_compare = [self.current_papers[num - 1] for num in numbers]
             
             self.console.print(f"\n[cyan]🔍 Comparing {len(papers_to_compare)} papers with AI...[/cyan]\n")
             
@@ -705,16 +943,11 @@ Your AI-powered physics research assistant. I can help you:
                 papers_info += f"Paper {i}:\n"
                 papers_info += f"Title: {paper.title}\n"
                 papers_info += f"Authors: {authors_str}\n"
-                # Limit abstract to avoid token overflow
-                abstract = paper.abstract[:400] if len(paper.abstract) > 400 else paper.abstract
-                papers_info += f"Abstract: {abstract}\n\n"
+                # Clipped once at construction to avoid token overflow
+                papers_info += f"Abstract: {paper.short_abstract}\n\n"
             
             # Use proper chat template format like in summarize_abstract
-            comparison_prompt = f"""<|system|>
-You are a research assistant helping to compare scientific papers. Provide clear, structured comparative analysis.
-</s>
-<|user|>
-Compare these {len(papers_to_compare)} research papers:
+            comparison_prompt = _COMPARE_PREFIX + f"""Compare these {len(papers_to_compare)} research papers:
 
 {papers_info}
 
@@ -733,57 +966,62 @@ Write a clear analysis:
 <|assistant|>
 """
             
-            with self.console.status("[bold cyan]AI analyzing papers...", spinner="dots"):
-                response = self.llm.generate(
-                    comparison_prompt,
-                    max_tokens=1000,
-                    temperature=0.4
+            # The prompt covers every input (papers and their order), so it is the key
+            cache_key = _response_key('compare', comparison_prompt)
+            cached = self.llm_cache.get(cache_key)
+            if cached:
+                response = cached['response']
+            else:
+                response = self._stream_to_panel(
+                    self.llm.generate_stream(
+                        comparison_prompt,
+                        max_tokens=1000,
+                        temperature=0.4
+                    ),
+                    title=f"Comparison of {len(papers_to_compare)} Papers",
+                    border_style="cyan"
                 )
-            
-            # Clean up response - remove any prompt artifacts
-            response = response.strip()
-            # Remove common artifacts
-            for prefix in ["Write your analysis now:", "TASK:", "Here is", "Analysis:"]:
-                if response.startswith(prefix):
-                    response = response[len(prefix):].strip()
-            
-            # If response is suspiciously short or contains prompt text, provide fallback
-            if len(response) < 100 or any(x in response.lower() for x in ["provide a comparative", "covering:", "task:"]):
-                response = self._generate_simple_comparison(papers_to_compare)
-            
-            # Display comparison
-            self.console.print(Panel(
+                
+                # Clean up response - remove any prompt artifacts
+                response = _RESP_STRIP_RE.sub('', response, count=1)
+                
+                # If response is suspiciously short or contains prompt text, provide fallback
+                # (not cached, so a later run can still get a real answer)
+                if len(response) < 100 or _RESP_BAD_RE.search(response):
+                    response = self._generate_simple_comparison(papers_to_compare)
+                else:
+                    self.llm_cache.set(cache_key, {'response': response})
+            
+            # Comparison panel
+            panel = Panel(
                 Markdown(f"## 📊 Comparative Analysis\n\n{response}"),
                 title=f"Comparison of {len(papers_to_compare)} Papers",
                 border_style="cyan",
                 box=box.ROUNDED
-            ))
+            )
             
-            # Show side-by-side summary table
-            table = Table(title="Side-by-Side Summary", box=box.ROUNDED)
-            table.add_column("#", style="cyan", width=3)
-            table.add_column("Title", style="white", width=35)
-            table.add_column("Year", style="yellow", width=6)
-            table.add_column("Citations", style="green", width=10)
-            table.add_column("Authors", style="dim", width=25)
+            # Side-by-side summary table
+            # Fixed widths with no_wrap: cells are pre-truncated, so Rich
+            # can skip measuring and wrapping them
+            table = Table(title="Side-by-Side Summary", box=box.ROUNDED, expand=False, pad_edge=False)
+            table.add_column("#", style="cyan", width=3, no_wrap=True, overflow="ellipsis")
+            table.add_column("Title", style="white", width=35, no_wrap=True, overflow="ellipsis")
+            table.add_column("Year", style="yellow", width=6, no_wrap=True, overflow="ellipsis")
+            table.add_column("Citations", style="green", width=10, no_wrap=True, overflow="ellipsis")
+            table.add_column("Authors", style="dim", width=25, no_wrap=True, overflow="ellipsis")
             
             for i, paper in enumerate(papers_to_compare, 1):
-                year = paper.published.year if hasattr(paper.published, 'year') else str(paper.published)[:4]
                 citations = str(paper.citation_count) if paper.citation_count > 0 else "-"
-                authors = ", ".join(paper.authors[:2])
-                if len(paper.authors) > 2:
-                    authors += " et al."
-                
                 table.add_row(
                     str(i),
-                    paper.title[:35] + ("..." if len(paper.title) > 35 else ""),
-                    str(year),
+                    ellipsize(paper.title, 35),
+                    _year_of(paper),
                     citations,
-                    authors
+                    paper.short_authors
                 )
             
-            self.console.print("\n")
-            self.console.print(table)
+            # Rendered together in a single console write
+            self.console.print(Group(panel, Text("\n"), table))
             
         except ValueError:
             self.console.print(f"[red]Error:[/red] Invalid paper numbers. Use format: 'compare 1 2 3'")
@@ -805,7 +1043,7 @@ Write a clear analysis:
             paper = self.current_papers[num - 1]
             
             # Download PDF
-            pdf_path = self.pdf_processor.download_pdf(paper.pdf_url, paper.id)
+            pdf_path = self._resolve_pdf_path(paper)
             
             if pdf_path:
                 # Show metadata
@@ -819,6 +1057,32 @@ Write a clear analysis:
         except Exception as e:
             self.console.print(f"[red]Error downloading PDF:[/red] {str(e)}")
     
+    def _resolve_pdf_path(self, paper: Paper) -> Optional[Path]:
+        """
+        Return the local PDF for a paper, downloading it on first use
+        
+        Resolved paths are remembered per paper id, so repeat commands on
+        the same paper cost a single existence check.
+        
+        Args:
+            paper: Paper whose PDF is needed
+            
+        Returns:
+            Path to the PDF, or None if the download failed
+        """
+        pdf_path = self._pdf_paths.get(paper.id)
+        if pdf_path is not None and pdf_path.exists():
+            return pdf_path
+        
+        pdf_path = self.pdf_processor.cached_path(paper.id)
+        if not pdf_path.exists():
+            pdf_path = self.pdf_processor.download_pdf(paper.pdf_url, paper.id)
+            if not pdf_path:
+                return None
+        
+        self._pdf_paths[paper.id] = pdf_path
+        return pdf_path
+    
     def handle_fulltext(self, paper_num: str):
         """Handle full-text extraction and display"""
         if not self.current_papers:
@@ -834,14 +1098,9 @@ Write a clear analysis:
             paper = self.current_papers[num - 1]
             
             # Download if needed
-            safe_id = paper.id.replace('/', '_').replace(':', '_')
-            pdf_path = self.pdf_processor.cache_dir / f"{safe_id}.pdf"
-            
-            if not pdf_path.exists():
-                self.console.print(f"[cyan]Downloading PDF first...[/cyan]")
-                pdf_path = self.pdf_processor.download_pdf(paper.pdf_url, paper.id)
-                if not pdf_path:
-                    return
+            pdf_path = self._resolve_pdf_path(paper)
+            if not pdf_path:
+                return
             
             # Extract sections
             self.console.print(f"\n[cyan]Extracting text from PDF...[/cyan]")
@@ -850,17 +1109,21 @@ Write a clear analysis:
             if sections:
                 self.console.print(f"[green]✓[/green] Extracted {len(sections)} sections\n")
                 
-                for section_name, content in list(sections.items())[:5]:  # Show first 5 sections
-                    self.console.print(Panel(
+                # Collect the section panels and print them in one write
+                output = []
+                for section_name, content in islice(sections.items(), 5):  # Show first 5 sections
+                    output.append(Panel(
                         content[:500] + ("..." if len(content) > 500 else ""),
                         title=f"📄 {section_name}",
                         border_style="blue",
                         box=box.ROUNDED
                     ))
-                    self.console.print()
+                    output.append(Text())
                 
                 if len(sections) > 5:
-                    self.console.print(f"[dim]... and {len(sections) - 5} more sections[/dim]\n")
+                    output.append(Text(f"... and {len(sections) - 5} more sections\n", style="dim"))
+                
+                self.console.print(Group(*output))
             else:
                 # Fallback: show first page
                 text = self.pdf_processor.extract_text(pdf_path, max_pages=1)
@@ -894,14 +1157,9 @@ Write a clear analysis:
             paper = self.current_papers[num - 1]
             
             # Download if needed
-            safe_id = paper.id.replace('/', '_').replace(':', '_')
-            pdf_path = self.pdf_processor.cache_dir / f"{safe_id}.pdf"
-            
-            if not pdf_path.exists():
-                self.console.print(f"[cyan]Downloading PDF first...[/cyan]")
-                pdf_path = self.pdf_processor.download_pdf(paper.pdf_url, paper.id)
-                if not pdf_path:
-                    return
+            pdf_path = self._resolve_pdf_path(paper)
+            if not pdf_path:
+                return
             
             # Search
             self.console.print(f"\n[cyan]🔍 Searching PDF for:[/cyan] '{query}'\n")
@@ -910,16 +1168,20 @@ Write a clear analysis:
             if matches:
                 self.console.print(f"[green]✓[/green] Found {len(matches)} matches\n")
                 
-                for i, match in enumerate(matches[:10], 1):  # Show first 10 matches
-                    self.console.print(f"[cyan]Match {i}:[/cyan]")
-                    # Highlight the query in context
-                    context = match['context'].replace(query, f"[bold yellow]{query}[/bold yellow]")
-                    context = context.replace(query.lower(), f"[bold yellow]{query.lower()}[/bold yellow]")
-                    context = context.replace(query.upper(), f"[bold yellow]{query.upper()}[/bold yellow]")
-                    self.console.print(f"  {context}\n")
+                # Collect the matches and print them in one write
+                output = []
+                # One case-insensitive pass highlights every spelling of the query
+                highlight = re.compile(re.escape(query), re.IGNORECASE)
+                for i, match in enumerate(islice(matches, 10), 1):  # Show first 10 matches
+                    output.append(Text(f"Match {i}:", style="cyan"))
+                    context = Text(f"  {match['context']}\n")
+                    context.highlight_regex(highlight, "bold yellow")
+                    output.append(context)
                 
                 if len(matches) > 10:
-                    self.console.print(f"[dim]... and {len(matches) - 10} more matches[/dim]")
+                    output.append(Text(f"... and {len(matches) - 10} more matches", style="dim"))
+                
+                self.console.print(Group(*output))
             else:
                 self.console.print(f"[yellow]No matches found for '{query}'[/yellow]")
                 
@@ -936,27 +1198,23 @@ Write a clear analysis:
             self.console.print("[red]Error:[/red] Vector store not available")
             return
         
-        stats = self.vector_store.get_stats()
+        stats = self._library_stats()
         
-        stats_text = f"""
-## 📚 Your Research Library
-
-**Total Papers:** {stats['total_papers']}
-
-**Embedding Model:** {stats.get('model', 'all-MiniLM-L6-v2')}
-
-**Vector Dimensions:** {stats.get('dimensions', 384)}
-
-**Capabilities:**
-- Semantic search by meaning
-- Find similar papers
-- Build research connections
-
-**Storage:** `./data/vectordb/`
-        """
+        # Fixed layout, so styled directly instead of parsed as Markdown
+        stats_text = Text.assemble(
+            ("📚 Your Research Library", "bold underline"), "\n\n",
+            ("Total Papers: ", "bold"), str(stats['total_papers']), "\n\n",
+            ("Embedding Model: ", "bold"), stats.get('model', 'all-MiniLM-L6-v2'), "\n\n",
+            ("Vector Dimensions: ", "bold"), str(stats.get('dimensions', 384)), "\n\n",
+            ("Capabilities:", "bold"), "\n",
+            "  • Semantic search by meaning\n",
+            "  • Find similar papers\n",
+            "  • Build research connections\n\n",
+            ("Storage: ", "bold"), ("./data/vectordb/", "cyan")
+        )
         
         self.console.print(Panel(
-            Markdown(stats_text),
+            stats_text,
             title="Library Statistics",
             border_style="cyan"
         ))
@@ -993,12 +1251,16 @@ Write a clear analysis:
             
             self.console.print(f"\n[cyan]🔗 Building citation network for {len(arxiv_ids)} papers...[/cyan]")
             
-            # Initialize citation graph
-            from deepsci.analysis.citation_graph import CitationGraph
-            self.citation_graph = CitationGraph()
+            # Initialize citation graph (reused across builds)
+            if self.citation_graph is None:
+                from deepsci.analysis.citation_graph import CitationGraph
+                self.citation_graph = CitationGraph()
             
-            # Build graph
-            graph = self.citation_graph.build_graph(arxiv_ids, include_references=True)
+            # Build graph, then release the HTTP session until the next build
+            try:
+                graph = self.citation_graph.build_graph(arxiv_ids, include_references=True)
+            finally:
+                self.citation_graph.close()
             
             # Show terminal visualization
             self.graph_visualizer.visualize_terminal(graph, max_nodes=15)
@@ -1102,6 +1364,39 @@ Write a clear analysis:
         except Exception as e:
             self.console.print(f"[red]Error finding path:[/red] {str(e)}")
     
+    def _require_args(self, handler):
+        """Wrap a handler so it is only called with a non-empty query"""
+        def guarded(args: str):
+            if not args:
+                self.console.print("[yellow]Please provide a search query[/yellow]")
+            else:
+                handler(args)
+        return guarded
+    
+    def _require_papers(self, handler, message: str):
+        """Wrap a handler so it is only called once there are results"""
+        def guarded(args: str):
+            if not self.current_papers:
+                self.console.print(f"[yellow]{message}[/yellow]")
+            else:
+                handler(args)
+        return guarded
+    
+    def handle_citations(self, args: str):
+        """Handle citations on/off command"""
+        if args == 'on':
+            self.fetch_citations = True
+            self.console.print("[green]✓[/green] Citation fetching enabled")
+        elif args == 'off':
+            self.fetch_citations = False
+            self.console.print("[yellow]⊘[/yellow] Citation fetching disabled (faster searches)")
+    
+    def handle_refresh(self, args: str):
+        """Handle refresh command (drop cached search results)"""
+        self.arxiv_client.clear_cache()
+        self._last_search = None
+        self.console.print("[green]✓[/green] Search cache cleared")
+    
     def run(self):
         """Main chat loop"""
         self.show_welcome()
@@ -1121,72 +1416,10 @@ Write a clear analysis:
                     self.console.print("\n[green]👋 Goodbye! Happy researching![/green]\n")
                     break
                 
-                elif cmd == 'help':
-                    self.show_help()
-                
-                elif cmd == 'search':
-                    if not args:
-                        self.console.print("[yellow]Please provide a search query[/yellow]")
-                    else:
-                        self.handle_search(args)
-                
-                elif cmd == 'show':
-                    if not self.current_papers:
-                        self.console.print("[yellow]No papers to show. Search for papers first.[/yellow]")
-                    else:
-                        self.handle_show(args)
-                
-                elif cmd == 'summarize':
-                    if not self.current_papers:
-                        self.console.print("[yellow]No papers to summarize. Search for papers first.[/yellow]")
-                    else:
-                        self.handle_summarize(args)
-                
-                elif cmd == 'save':
-                    self.handle_save(args)
-                
-                elif cmd == 'library_search':
-                    if not args:
-                        self.console.print("[yellow]Please provide a search query[/yellow]")
-                    else:
-                        self.handle_library_search(args)
-                
-                elif cmd == 'similar':
-                    self.handle_similar(args)
-                
-                elif cmd == 'compare':
-                    self.handle_compare(args)
-                
-                elif cmd == 'download_pdf':
-                    self.handle_download_pdf(args)
-                
-                elif cmd == 'fulltext':
-                    self.handle_fulltext(args)
-                
-                elif cmd == 'search_pdf':
-                    self.handle_search_pdf(args)
-                
-                elif cmd == 'graph':
-                    self.handle_graph(args)
-                
-                elif cmd == 'seminal':
-                    self.handle_seminal(args)
-                
-                elif cmd == 'path':
-                    self.handle_path(args)
-                
-                elif cmd == 'library_stats':
-                    self.handle_library_stats()
-                
-                elif cmd == 'citations':
-                    if args == 'on':
-                        self.fetch_citations = True
-                        self.console.print("[green]✓[/green] Citation fetching enabled")
-                    elif args == 'off':
-                        self.fetch_citations = False
-                        self.console.print("[yellow]⊘[/yellow] Citation fetching disabled (faster searches)")
-                
-                elif cmd == 'unknown':
+                handler = self._handlers.get(cmd)
+                if handler:
+                    handler(args)
+                else:
                     self.console.print("[yellow]I didn't understand that. Type 'help' for available commands.[/yellow]")
                 
             except KeyboardInterrupt:
@@ -1196,7 +1429,7 @@ Write a clear analysis:
                 break
             except Exception as e:
                 from rich.markup import escape
-                self.console.print(f"\n[red]Error:[/red] {escape(str(e))}")
+                self.console.print(f"\n[red]Error:[/red] {escape(str(e))}", highlight=True)
 
 
 def start_chat(use_llm: bool = True):
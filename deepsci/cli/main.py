@@ -10,9 +10,10 @@ from rich.table import Table
 from rich import box
 from deepsci import __version__
 from deepsci.sources.arxiv_client import ArxivClient
-from deepsci.cli.interactive import start_chat
+from deepsci.utils.text import ellipsize
 
-console = Console()
+# All output is styled explicitly, so skip Rich's regex highlighters
+console = Console(highlight=False)
 
 
 @click.group()
@@ -49,25 +50,22 @@ def search(query, sources, limit):
             title=f"Found {len(papers)} papers",
             box=box.ROUNDED,
             show_header=True,
-            header_style="bold cyan"
+            header_style="bold cyan",
+            expand=False,
+            pad_edge=False
         )
         
-        table.add_column("#", style="dim", width=3)
-        table.add_column("Title", style="bold", width=60)
-        table.add_column("Authors", style="green", width=30)
-        table.add_column("Year", style="blue", width=6)
+        # Cells are pre-truncated to these widths, so no wrapping pass is needed
+        table.add_column("#", style="dim", width=3, no_wrap=True, overflow="ellipsis")
+        table.add_column("Title", style="bold", width=60, no_wrap=True, overflow="ellipsis")
+        table.add_column("Authors", style="green", width=30, no_wrap=True, overflow="ellipsis")
+        table.add_column("Year", style="blue", width=6, no_wrap=True, overflow="ellipsis")
         
         for idx, paper in enumerate(papers, 1):
-            authors = ", ".join(paper.authors[:2])
-            if len(paper.authors) > 2:
-                authors += f" et al."
-            
-            title = paper.title if len(paper.title) <= 60 else paper.title[:57] + "..."
-            
             table.add_row(
                 str(idx),
-                title,
-                authors,
+                ellipsize(paper.title, 60),
+                paper.short_authors,
                 str(paper.published.year)
             )
         
@@ -113,6 +111,9 @@ def ask(question):
 @click.option('--no-ai', is_flag=True, help='Disable AI features for faster startup')
 def interactive(no_ai):
     """Start interactive chatbot mode"""
+    # Deferred so one-shot commands like 'search' don't load the chat UI
+    from deepsci.cli.interactive import start_chat
+    
     start_chat(use_llm=not no_ai)
 
 
@@ -4,15 +4,62 @@ Supports TinyLlama and other GGUF models
 """
 
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, Union
 from pathlib import Path
-import requests
-from llama_cpp import Llama
 from rich.console import Console
-from tqdm import tqdm
 
 console = Console()
 
+# Read size for model downloads (1 MiB keeps per-chunk Python overhead negligible)
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# RAM budget for llama.cpp's cache of evaluated prompt states
+PROMPT_CACHE_BYTES = 128 << 20
+
+# Prompt scaffolding for the task helpers, built once; only the fields vary
+_SUMMARIZE_TEMPLATE = """<|system|>
+You are a helpful research assistant. Provide concise, accurate summaries of scientific papers.
+</s>
+<|user|>
+Summarize this physics paper in 3-4 sentences. Focus on the main contribution and findings.
+
+Title: {title}
+
+Abstract: {abstract}
+
+Provide a clear summary:
+</s>
+<|assistant|>
+"""
+
+_KEY_POINTS_TEMPLATE = """<|system|>
+You are a research assistant. Extract the key findings from scientific papers.
+</s>
+<|user|>
+Extract 3-5 key points from this paper:
+
+Title: {title}
+
+Abstract: {abstract}
+
+List the key points:
+</s>
+<|assistant|>
+"""
+
+_ANSWER_TEMPLATE = """<|system|>
+You are a helpful research assistant. Answer questions based on the provided context.
+</s>
+<|user|>
+Context: {context}
+
+Question: {question}
+
+Answer:
+</s>
+<|assistant|>
+"""
+
 
 class ModelDownloader:
     """Download and manage LLM models"""
@@ -36,6 +83,14 @@ class ModelDownloader:
     def __init__(self, models_dir: str = "./models"):
         self.models_dir = Path(models_dir)
         self.models_dir.mkdir(parents=True, exist_ok=True)
+        self._session = None  # Created on first download
+    
+    def _get_session(self):
+        """Get the shared HTTP session (reuses the connection to the model host)"""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
     
     def download_model(self, model_name: str = "tinyllama-1.1b") -> Path:
         """
@@ -62,18 +117,22 @@ class ModelDownloader:
         console.print(f"[cyan]Downloading {model_name} ({model_info['size']})...[/cyan]")
         console.print(f"[dim]This may take a few minutes...[/dim]")
         
+        # Only needed for the one-time download
+        from tqdm import tqdm
+        
         try:
-            response = requests.get(model_info["url"], stream=True)
+            response = self._get_session().get(model_info["url"], stream=True)
             response.raise_for_status()
+            # Reading the raw stream directly; still undo any content encoding
+            response.raw.decode_content = True
             
             total_size = int(response.headers.get('content-length', 0))
             
             with open(model_path, 'wb') as f:
                 with tqdm(total=total_size, unit='B', unit_scale=True, desc=model_info["filename"]) as pbar:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            pbar.update(len(chunk))
+                    while chunk := response.raw.read(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        pbar.update(len(chunk))
             
             console.print(f"[green]✓[/green] Model downloaded successfully: {model_path}")
             return model_path
@@ -99,11 +158,20 @@ class LocalLLM:
         """
         Initialize the local LLM
         
+        The GGUF file is memory-mapped, so weights are paged in on demand and
+        a second DeepSci process shares them through the OS page cache. Set
+        DEEPSCI_MLOCK=1 to also lock them in RAM (avoids swapping in long
+        sessions, needs a sufficient memlock limit).
+        
         Args:
             model_path: Path to GGUF model file. If None, will auto-download TinyLlama
             n_ctx: Context window size
             n_gpu_layers: Number of layers to offload to GPU (0 = CPU only)
         """
+        # Imported here: the native extension is large and only needed
+        # once a model is actually loaded
+        from llama_cpp import Llama, LlamaRAMCache
+        
         self.downloader = ModelDownloader()
         
         # Auto-download if no model specified
@@ -117,9 +185,18 @@ class LocalLLM:
             model_path=model_path,
             n_ctx=n_ctx,
             n_gpu_layers=n_gpu_layers,
+            n_threads=os.cpu_count(),
+            n_batch=512,
+            use_mmap=True,
+            use_mlock=os.environ.get("DEEPSCI_MLOCK", "0") == "1",
             verbose=False
         )
         
+        # Keep recent prompt states in RAM: a prompt that shares a prefix with
+        # one of them (e.g. the same task's system prompt) resumes from the
+        # longest match instead of re-evaluating those tokens
+        self.llm.set_cache(LlamaRAMCache(capacity_bytes=PROMPT_CACHE_BYTES))
+        
         console.print("[green]✓[/green] Model loaded successfully!")
     
     def generate(
@@ -157,7 +234,44 @@ class LocalLLM:
         
         return response['choices'][0]['text'].strip()
     
-    def summarize_abstract(self, title: str, abstract: str, max_tokens: int = 256) -> str:
+    def generate_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 512,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        stop: Optional[list] = None
+    ) -> Iterator[str]:
+        """
+        Generate text from a prompt, yielding it as tokens are sampled
+        
+        Args:
+            prompt: Input prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0.0 = deterministic)
+            top_p: Nucleus sampling parameter
+            stop: Stop sequences
+            
+        Yields:
+            Text fragments (unstripped; join them for the full response)
+        """
+        if stop is None:
+            stop = ["</s>", "User:", "Human:"]
+        
+        for chunk in self.llm(
+            prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            stop=stop,
+            echo=False,
+            stream=True
+        ):
+            yield chunk['choices'][0]['text']
+    
+    def summarize_abstract(
+        self, title: str, abstract: str, max_tokens: int = 256, stream: bool = False
+    ) -> Union[str, Iterator[str]]:
         """
         Generate a concise summary of a paper abstract
         
@@ -165,28 +279,20 @@ class LocalLLM:
             title: Paper title
             abstract: Paper abstract
             max_tokens: Maximum tokens for summary
+            stream: Yield text fragments as they are generated
             
         Returns:
-            Summary text
+            Summary text (or an iterator of fragments when streaming)
         """
-        prompt = f"""<|system|>
-You are a helpful research assistant. Provide concise, accurate summaries of scientific papers.
-</s>
-<|user|>
-Summarize this physics paper in 3-4 sentences. Focus on the main contribution and findings.
-
-Title: {title}
-
-Abstract: {abstract}
-
-Provide a clear summary:
-</s>
-<|assistant|>
-"""
+        prompt = _SUMMARIZE_TEMPLATE.format(title=title, abstract=abstract)
         
+        if stream:
+            return self.generate_stream(prompt, max_tokens=max_tokens, temperature=0.3)
         return self.generate(prompt, max_tokens=max_tokens, temperature=0.3)
     
-    def extract_key_points(self, title: str, abstract: str, max_tokens: int = 256) -> str:
+    def extract_key_points(
+        self, title: str, abstract: str, max_tokens: int = 256, stream: bool = False
+    ) -> Union[str, Iterator[str]]:
         """
         Extract key points from a paper
         
@@ -194,28 +300,20 @@ Provide a clear summary:
             title: Paper title
             abstract: Paper abstract
             max_tokens: Maximum tokens
+            stream: Yield text fragments as they are generated
             
         Returns:
-            Key points as text
+            Key points as text (or an iterator of fragments when streaming)
         """
-        prompt = f"""<|system|>
-You are a research assistant. Extract the key findings from scientific papers.
-</s>
-<|user|>
-Extract 3-5 key points from this paper:
-
-Title: {title}
-
-Abstract: {abstract}
-
-List the key points:
-</s>
-<|assistant|>
-"""
+        prompt = _KEY_POINTS_TEMPLATE.format(title=title, abstract=abstract)
         
+        if stream:
+            return self.generate_stream(prompt, max_tokens=max_tokens, temperature=0.3)
         return self.generate(prompt, max_tokens=max_tokens, temperature=0.3)
     
-    def answer_question(self, question: str, context: str, max_tokens: int = 256) -> str:
+    def answer_question(
+        self, question: str, context: str, max_tokens: int = 256, stream: bool = False
+    ) -> Union[str, Iterator[str]]:
         """
         Answer a question based on paper context
         
@@ -223,21 +321,13 @@ List the key points:
             question: User's question
             context: Paper content or abstract
             max_tokens: Maximum tokens
+            stream: Yield text fragments as they are generated
             
         Returns:
-            Answer text
+            Answer text (or an iterator of fragments when streaming)
         """
-        prompt = f"""<|system|>
-You are a helpful research assistant. Answer questions based on the provided context.
-</s>
-<|user|>
-Context: {context}
-
-Question: {question}
-
-Answer:
-</s>
-<|assistant|>
-"""
+        prompt = _ANSWER_TEMPLATE.format(context=context, question=question)
         
+        if stream:
+            return self.generate_stream(prompt, max_tokens=max_tokens, temperature=0.5)
         return self.generate(prompt, max_tokens=max_tokens, temperature=0.5)
@@ -0,0 +1,132 @@
+"""
+Embedding cache to skip re-encoding texts that were embedded before
+"""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
+
+# Keys per SELECT ... IN (...), below SQLite's default variable limit
+_LOOKUP_CHUNK = 500
+
+
+class EmbeddingCache:
+    """Cache embeddings in SQLite, keyed by a hash of the model and the text"""
+    
+    def __init__(self, cache_file: str, model_name: str):
+        """
+        Initialize embedding cache
+        
+        Args:
+            cache_file: Path to the SQLite cache file
+            model_name: Embedding model; part of every key, so switching
+                models never returns stale vectors
+        """
+        self.cache_file = Path(cache_file)
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.model_name = model_name
+        # add_papers encodes on a worker thread, so the connection is shared
+        self._lock = threading.Lock()
+        self.conn = self._connect()
+    
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the cache database; None disables caching"""
+        try:
+            conn = sqlite3.connect(str(self.cache_file), check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vec BLOB NOT NULL)"
+            )
+            conn.commit()
+            return conn
+        except sqlite3.Error as e:
+            print(f"Warning: Could not open embedding cache {self.cache_file}: {e}")
+            return None
+    
+    def key(self, text: str) -> str:
+        """Cache key for a text embedded with this cache's model"""
+        return hashlib.sha256(f"{self.model_name}\x1f{text}".encode('utf-8')).hexdigest()
+    
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Get cached embeddings
+        
+        Args:
+            keys: Keys from key()
+        
+        Returns:
+            Dictionary mapping each cached key to its embedding
+        """
+        if self.conn is None or not keys:
+            return {}
+        
+        found = {}
+        try:
+            with self._lock:
+                for i in range(0, len(keys), _LOOKUP_CHUNK):
+                    chunk = keys[i:i + _LOOKUP_CHUNK]
+                    rows = self.conn.execute(
+                        f"SELECT key, vec FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})",
+                        chunk
+                    )
+                    for key, vec in rows:
+                        found[key] = np.frombuffer(vec, dtype=np.float32)
+        except sqlite3.Error as e:
+            print(f"Warning: Could not read embedding cache: {e}")
+        return found
+    
+    def set_many(self, entries: Dict[str, np.ndarray]):
+        """
+        Cache several embeddings in one transaction (only the new rows are written)
+        
+        Args:
+            entries: Dictionary mapping key() to embedding
+        """
+        if self.conn is None or not entries:
+            return
+        
+        rows = [
+            (key, np.asarray(embedding, dtype=np.float32).tobytes())
+            for key, embedding in entries.items()
+        ]
+        try:
+            with self._lock, self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vec) VALUES (?, ?)", rows
+                )
+        except sqlite3.Error as e:
+            print(f"Warning: Could not save embedding cache: {e}")
+    
+    def encode(self, texts: List[str], encoder) -> List[List[float]]:
+        """
+        Embed texts, only running the encoder on ones not seen before
+        
+        Args:
+            texts: Texts to embed
+            encoder: Callable taking a list of texts and returning a 2-D array
+        
+        Returns:
+            One embedding (list of floats) per text, in input order
+        """
+        keys = [self.key(text) for text in texts]
+        embeddings = self.get_many(list(dict.fromkeys(keys)))
+        
+        # Uncached texts, deduplicated (first-seen order) so a paper that
+        # appears twice, e.g. from merged arXiv + Scholar results, is
+        # encoded once
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in embeddings:
+                missing.setdefault(key, text)
+        
+        if missing:
+            new_entries = {
+                key: np.asarray(embedding, dtype=np.float32)
+                for key, embedding in zip(missing, encoder(list(missing.values())))
+            }
+            self.set_many(new_entries)
+            embeddings.update(new_entries)
+        
+        return [embeddings[key].tolist() for key in keys]
@@ -6,27 +6,46 @@ Enables semantic paper discovery and personal research library
 import chromadb
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import hashlib
 import os
 import warnings
 
+from deepsci.search.embedding_cache import EmbeddingCache
+
 # Suppress HuggingFace warnings
 os.environ['HF_HUB_DISABLE_SYMLINKS_WARNING'] = '1'
 os.environ['TOKENIZERS_PARALLELISM'] = 'false'
 warnings.filterwarnings('ignore', category=UserWarning, module='huggingface_hub')
 
+# Sentence embedding model (384 dimensions, ~23MB, fast on CPU)
+EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+# Graph-optimised (fused operators) ONNX export shipped in the model repo
+ONNX_MODEL_FILE = 'onnx/model_O3.onnx'
+# Papers per encode call / collection insert in add_papers
+ADD_BATCH_SIZE = 64
+# New collections rank by cosine distance over unit-length embeddings
+COLLECTION_METADATA = {
+    "description": "Physics research papers from arXiv",
+    "hnsw:space": "cosine"
+}
+
 
 class VectorStore:
     """Vector database for semantic paper search"""
     
-    def __init__(self, persist_directory: str = "./data/vectordb"):
+    def __init__(self, persist_directory: str = "./data/vectordb", use_onnx: Optional[bool] = None):
         """
         Initialize vector store
         
         Args:
             persist_directory: Directory to persist the database
+            use_onnx: Encode with ONNX Runtime instead of PyTorch (faster on
+                CPU; needs sentence-transformers[onnx]). Defaults to the
+                DEEPSCI_ONNX=1 environment setting
         """
         self.persist_directory = Path(persist_directory)
         self.persist_directory.mkdir(parents=True, exist_ok=True)
@@ -43,17 +62,68 @@ class VectorStore:
         # Get or create collection
         self.collection = self.client.get_or_create_collection(
             name="physics_papers",
-            metadata={"description": "Physics research papers from arXiv"}
+            metadata=COLLECTION_METADATA
         )
         
         # Initialize embedding model (lightweight model for CPU)
-        # all-MiniLM-L6-v2: 384 dimensions, ~23MB, fast on CPU
-        self.model = SentenceTransformer('all-MiniLM-L6-v2')
+        if use_onnx is None:
+            use_onnx = os.environ.get('DEEPSCI_ONNX', '0') == '1'
+        self.model = self._load_model(use_onnx)
+        
+        # Paper embeddings by content hash, so re-ingesting a paper (e.g.
+        # after clear_all) costs no forward pass
+        self.embedding_cache = EmbeddingCache(
+            str(self.persist_directory / "embedding_cache.sqlite3"),
+            model_name=EMBEDDING_MODEL
+        )
+        
+        # Per-instance LRU so repeated library searches skip the forward pass
+        self._query_embedding = lru_cache(maxsize=256)(self._encode_query)
         
     def _create_paper_id(self, paper_id: str) -> str:
         """Create a unique ID for a paper"""
         return hashlib.md5(paper_id.encode()).hexdigest()
     
+    @staticmethod
+    def _load_model(use_onnx: bool) -> SentenceTransformer:
+        """Load the embedding model, falling back to PyTorch if ONNX is unavailable"""
+        if use_onnx:
+            try:
+                return SentenceTransformer(
+                    EMBEDDING_MODEL,
+                    backend='onnx',
+                    model_kwargs={'file_name': ONNX_MODEL_FILE}
+                )
+            except Exception as e:
+                print(f"ONNX backend unavailable, using PyTorch: {e}")
+        return SentenceTransformer(EMBEDDING_MODEL)
+    
+    def _encode_texts(self, texts: List[str]):
+        """Embed a batch of paper texts in one encode call"""
+        return self.model.encode(
+            texts,
+            batch_size=ADD_BATCH_SIZE,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+    
+    def _encode_query(self, query: str) -> Tuple[float, ...]:
+        """Embed a search query (immutable result so it can be cached)"""
+        return tuple(self.model.encode(query, normalize_embeddings=True).tolist())
+    
+    def _similarity(self, distance: float) -> float:
+        """
+        Convert a Chroma distance to cosine similarity
+        
+        Collections created before the switch to cosine space still use
+        squared L2; for unit vectors that is 2 - 2*cos.
+        """
+        metadata = self.collection.metadata or {}
+        if metadata.get('hnsw:space', 'l2') == 'l2':
+            return 1 - distance / 2
+        return 1 - distance
+    
     def _create_embedding_text(self, paper: Dict[str, Any]) -> str:
         """
         Create text for embedding from paper metadata
@@ -72,6 +142,18 @@ class VectorStore:
         text = f"{title}. {title}. {abstract}"
         return text
     
+    def _create_metadata(self, paper: Dict[str, Any]) -> Dict[str, Any]:
+        """Prepare metadata (ensure all values are ChromaDB compatible)"""
+        return {
+            'arxiv_id': paper.get('id', ''),
+            'title': paper.get('title', '')[:500],  # Limit length
+            'authors': ', '.join(paper.get('authors', [])[:5])[:300],
+            'year': str(paper.get('year', '')),
+            'categories': ', '.join(paper.get('categories', [])[:5])[:200],
+            'citation_count': int(paper.get('citation_count', 0)),  # Ensure int
+            'url': paper.get('url', '')
+        }
+    
     def add_paper(self, paper: Dict[str, Any]) -> bool:
         """
         Add a paper to the vector store
@@ -90,26 +172,15 @@ class VectorStore:
             # Create embedding text
             text = self._create_embedding_text(paper)
             
-            # Generate embedding
-            embedding = self.model.encode(text).tolist()
-            
-            # Prepare metadata (ensure all values are ChromaDB compatible)
-            metadata = {
-                'arxiv_id': paper_id,
-                'title': paper.get('title', '')[:500],  # Limit length
-                'authors': ', '.join(paper.get('authors', [])[:5])[:300],
-                'year': str(paper.get('year', '')),
-                'categories': ', '.join(paper.get('categories', [])[:5])[:200],
-                'citation_count': int(paper.get('citation_count', 0)),  # Ensure int
-                'url': paper.get('url', '')
-            }
+            # Generate embedding (reused if this text was embedded before)
+            embedding = self.embedding_cache.encode([text], self._encode_texts)[0]
             
             # Add to collection
             unique_id = self._create_paper_id(paper_id)
             self.collection.add(
                 ids=[unique_id],
                 embeddings=[embedding],
-                metadatas=[metadata],
+                metadatas=[self._create_metadata(paper)],
                 documents=[paper.get('abstract', '')[:1000]]  # Store abstract snippet
             )
             
@@ -119,21 +190,84 @@ class VectorStore:
             print(f"Error adding paper: {e}")
             return False
     
-    def add_papers(self, papers: List[Dict[str, Any]]) -> int:
+    def add_papers(self, papers: List[Dict[str, Any]]) -> List[str]:
         """
         Add multiple papers to the vector store
         
+        Papers are embedded and inserted in batches of ADD_BATCH_SIZE. A
+        worker thread encodes the next batch while this thread writes the
+        current one to Chroma, so the SQLite insert overlaps the forward
+        pass (PyTorch/ONNX release the GIL while encoding). A batch that
+        fails is retried one paper at a time, so a bad paper only loses
+        itself.
+        
         Args:
             papers: List of paper dictionaries
             
         Returns:
-            Number of papers added successfully
+            IDs of the papers that were added, in input order (papers
+            already in the store are not included)
         """
-        count = 0
-        for paper in papers:
-            if self.add_paper(paper):
-                count += 1
-        return count
+        # Papers without an id are skipped; a repeated id keeps its last entry
+        by_id = {paper['id']: paper for paper in papers if paper.get('id')}
+        if not by_id:
+            return []
+        
+        # Chroma skips ids it already holds without raising, so drop them
+        # here to report only the papers actually inserted
+        unique_ids = [self._create_paper_id(paper_id) for paper_id in by_id]
+        existing = set()
+        try:
+            for i in range(0, len(unique_ids), ADD_BATCH_SIZE):
+                existing.update(
+                    self.collection.get(ids=unique_ids[i:i + ADD_BATCH_SIZE], include=[])['ids']
+                )
+        except Exception as e:
+            print(f"Error checking existing papers: {e}")
+            return []
+        
+        items = [
+            item for item, unique_id in zip(by_id.items(), unique_ids)
+            if unique_id not in existing
+        ]
+        if not items:
+            return []
+        
+        batches = [items[i:i + ADD_BATCH_SIZE] for i in range(0, len(items), ADD_BATCH_SIZE)]
+        
+        def encode(batch):
+            texts = [self._create_embedding_text(paper) for _, paper in batch]
+            return self.embedding_cache.encode(texts, self._encode_texts)
+        
+        added = []
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(encode, batches[0])
+            for i, batch in enumerate(batches):
+                try:
+                    embeddings = pending.result()
+                except Exception as e:
+                    embeddings = None
+                    print(f"Error encoding batch, retrying papers individually: {e}")
+                
+                if i + 1 < len(batches):
+                    pending = executor.submit(encode, batches[i + 1])
+                
+                if embeddings is not None:
+                    try:
+                        self.collection.add(
+                            ids=[self._create_paper_id(paper_id) for paper_id, _ in batch],
+                            embeddings=embeddings,
+                            metadatas=[self._create_metadata(paper) for _, paper in batch],
+                            documents=[paper.get('abstract', '')[:1000] for _, paper in batch]
+                        )
+                        added.extend(paper_id for paper_id, _ in batch)
+                        continue
+                    except Exception as e:
+                        print(f"Error adding batch, retrying papers individually: {e}")
+                
+                added.extend(paper_id for paper_id, paper in batch if self.add_paper(paper))
+        
+        return added
     
     def search(self, query: str, n_results: int = 10) -> List[Dict[str, Any]]:
         """
@@ -147,8 +281,8 @@ class VectorStore:
             List of matching papers with metadata
         """
         try:
-            # Generate query embedding
-            query_embedding = self.model.encode(query).tolist()
+            # Generate query embedding (cached per exact query string)
+            query_embedding = list(self._query_embedding(query))
             
             # Search in collection
             results = self.collection.query(
@@ -170,7 +304,7 @@ class VectorStore:
                         'citation_count': int(metadata.get('citation_count', 0)),  # Ensure int
                         'url': metadata.get('url', ''),
                         'abstract': results['documents'][0][i] if results['documents'] else '',
-                        'similarity': 1 - results['distances'][0][i],  # Convert distance to similarity
+                        'similarity': self._similarity(results['distances'][0][i]),
                         'source': 'library'
                     }
                     papers.append(paper)
@@ -228,7 +362,7 @@ class VectorStore:
                             'citation_count': int(metadata.get('citation_count', 0)),  # Ensure int
                             'url': metadata.get('url', ''),
                             'abstract': results['documents'][0][i] if results['documents'] else '',
-                            'similarity': 1 - results['distances'][0][i],
+                            'similarity': self._similarity(results['distances'][0][i]),
                             'source': 'library'
                         }
                         papers.append(paper)
@@ -250,7 +384,7 @@ class VectorStore:
             count = self.collection.count()
             return {
                 'total_papers': count,
-                'model': 'all-MiniLM-L6-v2',
+                'model': EMBEDDING_MODEL,
                 'dimensions': 384,
                 'collection_name': self.collection.name
             }
@@ -281,7 +415,7 @@ class VectorStore:
             self.client.delete_collection(name="physics_papers")
             self.collection = self.client.create_collection(
                 name="physics_papers",
-                metadata={"description": "Physics research papers from arXiv"}
+                metadata=COLLECTION_METADATA
             )
             return True
         except:
@@ -1,6 +1,20 @@
-from .arxiv_client import ArxivClient, Paper
-from .citation_client import CitationClient
-from .scholar_client import ScholarClient
-from .pdf_processor import PDFProcessor
+import importlib
+
+# Submodules are imported on first attribute access so that, e.g., importing
+# ArxivClient does not also pull in scholarly and semanticscholar
+_EXPORTS = {
+    'ArxivClient': '.arxiv_client',
+    'Paper': '.arxiv_client',
+    'CitationClient': '.citation_client',
+    'ScholarClient': '.scholar_client',
+    'PDFProcessor': '.pdf_processor',
+}
 
 __all__ = ['ArxivClient', 'Paper', 'CitationClient', 'ScholarClient', 'PDFProcessor']
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
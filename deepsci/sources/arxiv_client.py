@@ -4,12 +4,14 @@ arXiv API client for searching and retrieving physics papers
 
 import arxiv
 import time
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from collections import OrderedDict
+from sys import intern
+from typing import List, Dict, Any, Iterator, Optional
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Paper:
     """Represents a research paper"""
     id: str
@@ -24,25 +26,60 @@ class Paper:
     citation_count: int = 0
     influential_citations: int = 0
     source: str = "arxiv"
+    similarity: Optional[float] = None  # Set for results from the semantic library
+    year: Optional[int] = field(init=False, default=None)
+    # Display strings for result tables, computed once per paper
+    short_title: str = field(init=False, default="", repr=False, compare=False)
+    short_authors: str = field(init=False, default="", repr=False, compare=False)
+    # Abstract clipped for LLM prompts (keeps comparison prefill short)
+    short_abstract: str = field(init=False, default="", repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Derived once so displays don't re-inspect the date every render
+        self.year = self.published.year if self.published else None
+        
+        title = self.title
+        self.short_title = title if len(title) <= 80 else title[:77] + "..."
+        
+        authors = self.authors
+        n = len(authors)
+        if n == 0:
+            self.short_authors = ""
+        elif n == 1:
+            self.short_authors = authors[0]
+        elif n == 2:
+            self.short_authors = f"{authors[0]}, {authors[1]}"
+        else:
+            self.short_authors = f"{authors[0]}, {authors[1]} et al."
+        
+        self.short_abstract = self.abstract[:400]
     
     def __str__(self) -> str:
         authors_str = ", ".join(self.authors[:3])
         if len(self.authors) > 3:
             authors_str += f" et al. ({len(self.authors)} authors)"
         citations = f" | {self.citation_count} citations" if self.citation_count > 0 else ""
-        return f"{self.title}\n{authors_str}\n{self.published.year}{citations} | {self.url}"
+        return f"{self.title}\n{authors_str}\n{self.year or 'N/A'}{citations} | {self.url}"
 
 
 class ArxivClient:
     """Client for interacting with arXiv API with rate limiting"""
     
-    def __init__(self, max_results: int = 10, delay_seconds: float = 3.0):
+    def __init__(
+        self,
+        max_results: int = 10,
+        delay_seconds: float = 3.0,
+        cache_size: int = 128,
+        cache_ttl: float = 3600.0
+    ):
         """
         Initialize arXiv client
         
         Args:
             max_results: Default maximum results per query
             delay_seconds: Delay between requests (arXiv recommends 3+ seconds)
+            cache_size: Number of searches to keep in memory (0 disables caching)
+            cache_ttl: Seconds before a cached search is fetched again
         """
         self.max_results = max_results
         self.delay_seconds = delay_seconds
@@ -52,6 +89,9 @@ class ArxivClient:
             num_retries=3
         )
         self.last_request_time = 0
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._search_cache: OrderedDict = OrderedDict()
     
     def _wait_for_rate_limit(self):
         """Ensure we don't exceed arXiv's rate limit"""
@@ -60,6 +100,34 @@ class ArxivClient:
             time.sleep(self.delay_seconds - elapsed)
         self.last_request_time = time.time()
     
+    def _get_cached_search(self, key: tuple) -> Optional[List[Paper]]:
+        """Return copies of cached search results, or None on a miss"""
+        entry = self._search_cache.get(key)
+        if entry is None:
+            return None
+        
+        cached_at, papers = entry
+        if time.time() - cached_at > self.cache_ttl:
+            del self._search_cache[key]
+            return None
+        
+        self._search_cache.move_to_end(key)
+        return [replace(paper) for paper in papers]
+    
+    def _cache_search(self, key: tuple, papers: List[Paper]):
+        """Store search results, evicting the least recently used entry"""
+        if self.cache_size <= 0:
+            return
+        
+        self._search_cache[key] = (time.time(), tuple(replace(paper) for paper in papers))
+        self._search_cache.move_to_end(key)
+        while len(self._search_cache) > self.cache_size:
+            self._search_cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """Forget all cached search results"""
+        self._search_cache.clear()
+    
     def search(
         self,
         query: str,
@@ -81,9 +149,47 @@ class ArxivClient:
         Returns:
             List of Paper objects
         """
+        papers = list(self.iter_search(query, max_results, sort_by, categories))
+        
+        # Fetch citations if requested
+        if fetch_citations and papers:
+            papers = self._enrich_with_citations(papers)
+        
+        return papers
+    
+    def iter_search(
+        self,
+        query: str,
+        max_results: Optional[int] = None,
+        sort_by: arxiv.SortCriterion = arxiv.SortCriterion.Relevance,
+        categories: Optional[List[str]] = None
+    ) -> Iterator[Paper]:
+        """
+        Search arXiv, yielding papers as the results are parsed
+        
+        Results are cached once the search has been fully consumed, so a
+        repeat search is answered from memory.
+        
+        Args:
+            query: Search query string
+            max_results: Maximum number of results to return
+            sort_by: Sort criterion (Relevance, LastUpdatedDate, SubmittedDate)
+            categories: Filter by arXiv categories (e.g., ['physics.quant-ph'])
+        
+        Yields:
+            Paper objects in result order
+        """
         if max_results is None:
             max_results = self.max_results
         
+        # Repeat searches are served from memory; citations are fetched
+        # separately so the cached entries stay independent of them
+        cache_key = (query, max_results, sort_by, tuple(categories or ()))
+        cached = self._get_cached_search(cache_key)
+        if cached is not None:
+            yield from cached
+            return
+        
         # Add category filter to query if specified
         if categories:
             cat_query = " OR ".join([f"cat:{cat}" for cat in categories])
@@ -104,16 +210,18 @@ class ArxivClient:
                 paper = Paper(
                     id=result.entry_id.split('/')[-1],
                     title=result.title,
-                    authors=[author.name for author in result.authors],
+                    # Interned: the same names/categories recur across results
+                    authors=[intern(author.name) for author in result.authors],
                     abstract=result.summary,
                     published=result.published,
                     updated=result.updated,
                     url=result.entry_id,
                     pdf_url=result.pdf_url,
-                    categories=result.categories,
+                    categories=[intern(category) for category in result.categories],
                     source="arxiv"
                 )
                 papers.append(paper)
+                yield paper
         except Exception as e:
             # Re-raise with more helpful message
             if "429" in str(e):
@@ -123,11 +231,7 @@ class ArxivClient:
                 )
             raise
         
-        # Fetch citations if requested
-        if fetch_citations and papers:
-            papers = self._enrich_with_citations(papers)
-        
-        return papers
+        self._cache_search(cache_key, papers)
     
     def _enrich_with_citations(self, papers: List[Paper]) -> List[Paper]:
         """
@@ -140,10 +244,63 @@ class ArxivClient:
             Papers with citation counts added
         """
         from deepsci.sources.citation_client import CitationClient
-        import concurrent.futures
-        from rich.progress import Progress, SpinnerColumn, TextColumn
         
         citation_client = CitationClient()
+        for _ in self.iter_citations(papers, citation_client):
+            pass
+        
+        # Print stats for debugging (optional)
+        if papers and citation_client.stats['total_attempts'] > 0:
+            success_rate = (citation_client.stats['semantic_scholar_success'] / 
+                          citation_client.stats['total_attempts'] * 100)
+            # Only show if there were issues
+            if success_rate < 80:
+                from rich.console import Console
+                console = Console()
+                console.print(f"[dim]  Citation fetch: {citation_client.stats['semantic_scholar_success']}/{citation_client.stats['total_attempts']} success, "
+                            f"{citation_client.stats['scholar_fallback_used']} from Scholar[/dim]")
+        
+        return papers
+    
+    def iter_citations(self, papers: List[Paper], citation_client=None) -> Iterator[Paper]:
+        """
+        Fetch citation data in parallel, yielding papers as their counts arrive
+        
+        Papers are updated in place, so callers can re-render results
+        after each yielded paper instead of waiting for the whole batch.
+        
+        Args:
+            papers: List of Paper objects
+            citation_client: Optional CitationClient to reuse
+            
+        Yields:
+            Each Paper once its citation lookup has finished
+        """
+        from deepsci.sources.citation_client import CitationClient
+        import concurrent.futures
+        
+        if citation_client is None:
+            citation_client = CitationClient()
+        
+        # One batch request covers most papers; only the misses are looked
+        # up one by one (which also tries the Google Scholar fallback)
+        try:
+            found = citation_client.get_citations_batch([paper.id for paper in papers])
+        except Exception:
+            found = {}
+        
+        remaining = []
+        for paper in papers:
+            metrics = found.get(paper.id)
+            if metrics:
+                paper.citation_count = metrics['citation_count']
+                paper.influential_citations = metrics['influential_citations']
+                yield paper
+            else:
+                remaining.append(paper)
+        
+        if not remaining:
+            return
         
         def fetch_citation(paper):
             """Fetch citation for a single paper"""
@@ -162,22 +319,12 @@ class ArxivClient:
                 pass
             return paper
         
-        # Use thread pool for parallel fetching
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            papers = list(executor.map(fetch_citation, papers))
-        
-        # Print stats for debugging (optional)
-        if papers and citation_client.stats['total_attempts'] > 0:
-            success_rate = (citation_client.stats['semantic_scholar_success'] / 
-                          citation_client.stats['total_attempts'] * 100)
-            # Only show if there were issues
-            if success_rate < 80:
-                from rich.console import Console
-                console = Console()
-                console.print(f"[dim]  Citation fetch: {citation_client.stats['semantic_scholar_success']}/{citation_client.stats['total_attempts']} success, "
-                            f"{citation_client.stats['scholar_fallback_used']} from Scholar[/dim]")
-        
-        return papers
+        # Use thread pool for parallel fetching, one worker per miss (up to 10)
+        # so a full page of results is looked up in a single round trip
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(10, len(remaining))) as executor:
+            futures = [executor.submit(fetch_citation, paper) for paper in remaining]
+            for future in concurrent.futures.as_completed(futures):
+                yield future.result()
     
     def get_paper(self, paper_id: str) -> Optional[Paper]:
         """
@@ -202,13 +349,13 @@ class ArxivClient:
             return Paper(
                 id=result.entry_id.split('/')[-1],
                 title=result.title,
-                authors=[author.name for author in result.authors],
+                authors=[intern(author.name) for author in result.authors],
                 abstract=result.summary,
                 published=result.published,
                 updated=result.updated,
                 url=result.entry_id,
                 pdf_url=result.pdf_url,
-                categories=result.categories
+                categories=[intern(category) for category in result.categories]
             )
         except StopIteration:
             return None
@@ -237,7 +384,7 @@ class ArxivClient:
         self._wait_for_rate_limit()
         
         # Create a safe filename
-        safe_title = "".join(c for c in paper.title if c.isalnum() or c in (' ', '-', '_')).strip()
+        safe_title = "".join(c for c in paper.title if c.isalnum() or c in {' ', '-', '_'}).strip()
         safe_title = safe_title[:100]  # Limit length
         filename = f"{paper.id}_{safe_title}.pdf"
         filepath = os.path.join(directory, filename)
@@ -25,21 +25,29 @@ class CitationCache:
         self.cache = self._load_cache()
     
     def _load_cache(self) -> Dict[str, Any]:
-        """Load cache from disk"""
+        """Load cache from disk (orjson when installed, else the stdlib decoder)"""
         if not self.cache_file.exists():
             return {}
         
         try:
-            with open(self.cache_file, 'r') as f:
-                return json.load(f)
+            try:
+                import orjson
+                return orjson.loads(self.cache_file.read_bytes())
+            except ImportError:
+                with open(self.cache_file, 'r') as f:
+                    return json.load(f)
         except:
             return {}
     
     def _save_cache(self):
-        """Save cache to disk"""
+        """Save cache to disk (orjson when installed, else the stdlib encoder)"""
         try:
-            with open(self.cache_file, 'w') as f:
-                json.dump(self.cache, f, indent=2)
+            try:
+                import orjson
+                self.cache_file.write_bytes(orjson.dumps(self.cache, option=orjson.OPT_INDENT_2))
+            except ImportError:
+                with open(self.cache_file, 'w') as f:
+                    json.dump(self.cache, f, indent=2)
         except Exception as e:
             print(f"Warning: Could not save citation cache: {e}")
     
@@ -81,6 +89,24 @@ class CitationCache:
         }
         self._save_cache()
     
+    def set_many(self, entries: Dict[str, Dict[str, Any]]):
+        """
+        Cache several entries with a single write to disk
+        
+        Args:
+            entries: Dictionary mapping paper identifier to data
+        """
+        if not entries:
+            return
+        
+        cached_at = datetime.now().isoformat()
+        for paper_id, data in entries.items():
+            self.cache[paper_id] = {
+                'data': data,
+                'cached_at': cached_at
+            }
+        self._save_cache()
+    
     def clear_expired(self):
         """Remove expired entries from cache"""
         now = datetime.now()
@@ -4,15 +4,31 @@ Enhanced with retry logic, fallback to Google Scholar, caching, and better error
 """
 
 from semanticscholar import SemanticScholar
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+import os
 import time
 import logging
+import requests
 from deepsci.sources.citation_cache import CitationCache
 
 # Set up logging for debugging
 logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
+# Semantic Scholar batch endpoint (up to 500 IDs per request)
+S2_BATCH_URL = "https://api.semanticscholar.org/graph/v1/paper/batch"
+BATCH_SIZE = 500
+
+METRIC_FIELDS = [
+    'citationCount',
+    'influentialCitationCount',
+    'referenceCount',
+    'year',
+    'fieldsOfStudy',
+    'publicationVenue',
+    's2FieldsOfStudy'
+]
+
 
 class CitationClient:
     """Client for fetching citation metrics from Semantic Scholar with fallbacks"""
@@ -33,6 +49,7 @@ class CitationClient:
         self.scholar_client = None
         self.use_cache = use_cache
         self.cache = CitationCache() if use_cache else None
+        self._session = None  # Created on first batch request
         
         # Statistics for debugging
         self.stats = {
@@ -50,6 +67,20 @@ class CitationClient:
             time.sleep(self.delay_seconds - elapsed)
         self.last_request_time = time.time()
     
+    def _get_session(self) -> requests.Session:
+        """Get the shared HTTP session (keep-alive connection pool)"""
+        if self._session is None:
+            self._session = requests.Session()
+            api_key = os.environ.get('S2_API_KEY')
+            if api_key:
+                self._session.headers['x-api-key'] = api_key
+        return self._session
+    
+    @staticmethod
+    def _clean_arxiv_id(arxiv_id: str) -> str:
+        """Strip the arXiv prefix and version suffix used in cache keys"""
+        return arxiv_id.replace('arxiv:', '').replace('arXiv:', '').replace('v1', '').replace('v2', '').replace('v3', '')
+    
     def _get_scholar_fallback(self, title: str) -> Optional[Dict[str, Any]]:
         """
         Fallback to Google Scholar for citation counts
@@ -101,7 +132,7 @@ class CitationClient:
         self.stats['total_attempts'] += 1
         
         # Clean arxiv ID
-        arxiv_id = arxiv_id.replace('arxiv:', '').replace('arXiv:', '').replace('v1', '').replace('v2', '').replace('v3', '')
+        arxiv_id = self._clean_arxiv_id(arxiv_id)
         
         # Check cache first
         if self.cache:
@@ -116,15 +147,7 @@ class CitationClient:
                 self._wait_for_rate_limit()
                 
                 # Search by arXiv ID
-                paper = self.sch.get_paper(f'arXiv:{arxiv_id}', fields=[
-                    'citationCount',
-                    'influentialCitationCount',
-                    'referenceCount',
-                    'year',
-                    'fieldsOfStudy',
-                    'publicationVenue',
-                    's2FieldsOfStudy'
-                ])
+                paper = self.sch.get_paper(f'arXiv:{arxiv_id}', fields=METRIC_FIELDS)
                 
                 if not paper:
                     logger.debug(f"Paper not found in Semantic Scholar: {arxiv_id}")
@@ -170,6 +193,76 @@ class CitationClient:
         
         return None
     
+    def get_citations_batch(self, arxiv_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get citation metrics for many papers with Semantic Scholar batch lookups
+        
+        Cached papers are served from disk; the rest are posted up to
+        BATCH_SIZE at a time over one pooled connection. Papers that are
+        not found are left out, so callers can fall back to
+        get_citations_by_arxiv_id (and its Scholar fallback) for them.
+        
+        Args:
+            arxiv_ids: arXiv IDs (e.g., ['2301.12345', '2302.00001v2'])
+            
+        Returns:
+            Dictionary mapping each found arXiv ID (as given) to its metrics
+        """
+        results = {}
+        missing = {}  # cleaned ID -> IDs as given
+        for arxiv_id in arxiv_ids:
+            clean_id = self._clean_arxiv_id(arxiv_id)
+            cached = self.cache.get(clean_id) if self.cache else None
+            if cached:
+                self.stats['cache_hits'] += 1
+                results[arxiv_id] = cached
+            else:
+                missing.setdefault(clean_id, []).append(arxiv_id)
+        
+        clean_ids = list(missing)
+        fetched = {}
+        for start in range(0, len(clean_ids), BATCH_SIZE):
+            chunk = clean_ids[start:start + BATCH_SIZE]
+            
+            try:
+                self._wait_for_rate_limit()
+                response = self._get_session().post(
+                    S2_BATCH_URL,
+                    params={'fields': ','.join(METRIC_FIELDS)},
+                    json={'ids': [f'ARXIV:{clean_id}' for clean_id in chunk]},
+                    timeout=10
+                )
+                response.raise_for_status()
+                papers = response.json()
+            except Exception as e:
+                logger.debug(f"Semantic Scholar batch of {len(chunk)} papers failed: {str(e)[:100]}")
+                continue
+            
+            # Results are positional: one entry per requested ID, null if not found
+            for clean_id, paper in zip(chunk, papers):
+                if paper:
+                    venue = paper.get('publicationVenue')
+                    fetched[clean_id] = {
+                        'citation_count': paper.get('citationCount') or 0,
+                        'influential_citations': paper.get('influentialCitationCount') or 0,
+                        'reference_count': paper.get('referenceCount') or 0,
+                        'year': paper.get('year'),
+                        'fields': paper.get('fieldsOfStudy') or [],
+                        'venue': venue.get('name') if venue else None,
+                        's2_fields': [f.get('category') for f in (paper.get('s2FieldsOfStudy') or [])],
+                    }
+        
+        if self.cache:
+            self.cache.set_many(fetched)
+        
+        for clean_id, metrics in fetched.items():
+            for arxiv_id in missing[clean_id]:
+                results[arxiv_id] = metrics
+        
+        self.stats['semantic_scholar_success'] += len(fetched)
+        self.stats['total_attempts'] += len(results)
+        return results
+    
     def get_citations_by_doi(self, doi: str) -> Optional[Dict[str, Any]]:
         """
         Get citation metrics for a paper by DOI
@@ -25,6 +25,20 @@ class PDFProcessor:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
     
+    def cached_path(self, paper_id: str) -> Path:
+        """
+        Path where the PDF for a paper is (or would be) cached
+        
+        Args:
+            paper_id: Unique identifier for the paper
+            
+        Returns:
+            Path inside the cache directory; the file may not exist yet
+        """
+        # Sanitize paper_id for filename
+        safe_id = paper_id.replace('/', '_').replace(':', '_')
+        return self.cache_dir / f"{safe_id}.pdf"
+    
     def download_pdf(self, url: str, paper_id: str, force_download: bool = False) -> Optional[Path]:
         """
         Download PDF from URL
@@ -37,9 +51,7 @@ class PDFProcessor:
         Returns:
             Path to downloaded PDF or None if failed
         """
-        # Sanitize paper_id for filename
-        safe_id = paper_id.replace('/', '_').replace(':', '_')
-        pdf_path = self.cache_dir / f"{safe_id}.pdf"
+        pdf_path = self.cached_path(paper_id)
         
         # Check cache
         if pdf_path.exists() and not force_download:
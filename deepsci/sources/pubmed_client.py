@@ -4,10 +4,14 @@ PubMed E-utilities client for biomedical and biophysics literature
 
 from Bio import Entrez
 from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+import re
 import time
 
+# Leading four-digit year of a published_date string
+_YEAR_RE = re.compile(r'(\d{4})')
+
 
 @dataclass
 class PubMedPaper:
@@ -20,6 +24,12 @@ class PubMedPaper:
     published_date: str
     doi: Optional[str]
     url: str
+    year: Optional[int] = field(init=False, default=None)
+    
+    def __post_init__(self):
+        # published_date is "YYYY-MM-DD" or just "YYYY" (or "Unknown")
+        match = _YEAR_RE.match(self.published_date)
+        self.year = int(match.group(1)) if match else None
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -0,0 +1,22 @@
+"""
+Small text helpers shared by the CLI displays
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=2048)
+def ellipsize(text: str, width: int) -> str:
+    """
+    Shorten text to at most `width` characters, ending in "..." when cut
+    
+    Cached, since the same titles are rendered again and again.
+    
+    Args:
+        text: Text to shorten
+        width: Maximum length of the result
+        
+    Returns:
+        The text itself, or its first width - 3 characters plus "..."
+    """
+    return text if len(text) <= width else text[:width - 3] + "..."
@@ -0,0 +1,34 @@
+"""
+Tests for natural-language command parsing in the interactive chat
+"""
+
+import pytest
+
+pytest.importorskip("rich")
+pytest.importorskip("arxiv")
+
+from deepsci.cli.interactive import DeepSciChat
+
+
+@pytest.fixture
+def chat():
+    # parse_command needs no clients, so skip __init__
+    return DeepSciChat.__new__(DeepSciChat)
+
+
+@pytest.mark.parametrize("user_input, expected", [
+    ("show 3", ("show", "3")),
+    ("show paper 3", ("show", "3")),
+    ("show me paper 3", ("show", "3")),
+    ("summarize paper 2", ("summarize", "2")),
+    ("show 3 papers", ("show", "3")),
+    ("summarize 2 please", ("summarize", "2")),
+    ("show 12abc", ("show", "12")),
+    ("Show Me The Paper 4", ("show", "4")),
+])
+def test_show_and_summarize_take_first_number(chat, user_input, expected):
+    assert chat.parse_command(user_input) == expected
+
+
+def test_show_without_number_is_not_a_show_command(chat):
+    assert chat.parse_command("show me papers on dark matter")[0] != "show"